@@ -355,6 +355,10 @@ async def async_serve(
         yield app
 
 
+# Shared so strict-mode conversions are memoized across to_openai_tools() calls.
+_openai_converter = OpenAIConverter()
+
+
 def to_openai_tools(
     registry_or_executor: object,
     *,
@@ -377,8 +381,7 @@ def to_openai_tools(
         openai.chat.completions.create(tools=...).
     """
     registry = resolve_registry(registry_or_executor)
-    converter = OpenAIConverter()
-    tools = converter.convert_registry(
+    tools = _openai_converter.convert_registry(
         registry,
         embed_annotations=embed_annotations,
         strict=strict,
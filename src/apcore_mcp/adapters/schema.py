@@ -2,10 +2,32 @@
 
 from __future__ import annotations
 
-import copy
+import json
+import threading
+from collections import OrderedDict
+from collections.abc import Mapping
 from typing import Any
 
 _MAX_REF_DEPTH = 32
+_SCHEMA_CACHE_SIZE = 512
+
+
+def _copy_schema(node: Any) -> Any:
+    """Return a structural copy of a JSON Schema tree.
+
+    Mappings (including read-only ones such as ``types.MappingProxyType``)
+    become fresh dicts and lists become fresh lists; all other values are
+    shared. Cheaper than ``copy.deepcopy`` for plain schema data, which has
+    no cycles or shared sub-objects to memoize.
+    """
+    # Exact-type checks first: plain dicts and lists are the common case and
+    # skip the comparatively slow Mapping ABC check.
+    node_type = type(node)
+    if node_type is dict or (node_type is not list and isinstance(node, Mapping)):
+        return {key: _copy_schema(value) for key, value in node.items()}
+    if node_type is list or isinstance(node, list):
+        return [_copy_schema(item) for item in node]
+    return node
 
 
 class SchemaConverter:
@@ -15,9 +37,22 @@ class SchemaConverter:
     - Empty schemas → {"type": "object", "properties": {}}
     - Schemas with $defs and $ref → inline all refs, strip $defs
     - Ensures all schemas have "type": "object" at the root level
-    - Returns deep copies (doesn't modify original schemas)
+    - Returns deep copies (doesn't modify original schemas); read-only
+      mappings such as ``types.MappingProxyType`` are accepted as input
+
+    Schemas that carry ``$defs`` are memoized per instance by content, so
+    descriptors sharing an identical schema pay for ``$ref`` inlining once.
     """
 
+    def __init__(self) -> None:
+        self._cache: OrderedDict[str, dict[str, Any]] = OrderedDict()
+        self._cache_lock = threading.Lock()
+
+    def clear_cache(self) -> None:
+        """Drop all memoized schema conversions."""
+        with self._cache_lock:
+            self._cache.clear()
+
     def convert_input_schema(self, descriptor: Any) -> dict[str, Any]:
         """Convert apcore ModuleDescriptor.input_schema to MCP inputSchema.
 
@@ -51,8 +86,38 @@ class SchemaConverter:
         Returns:
             Converted schema with $refs inlined, $defs removed, and type ensured
         """
+        # Only $ref inlining is worth memoizing by content; other schemas
+        # convert for about the cost of computing their key.
+        key = self._cache_key(schema) if isinstance(schema, Mapping) and "$defs" in schema else None
+        if key is None:
+            return self._convert_uncached(schema)
+
+        with self._cache_lock:
+            converted = self._cache.get(key)
+            if converted is not None:
+                self._cache.move_to_end(key)
+        if converted is None:
+            converted = self._convert_uncached(schema)
+            with self._cache_lock:
+                self._cache[key] = converted
+                if len(self._cache) > _SCHEMA_CACHE_SIZE:
+                    self._cache.popitem(last=False)
+        # Hand out copies so callers can't corrupt the cached schema.
+        result: dict[str, Any] = _copy_schema(converted)
+        return result
+
+    @staticmethod
+    def _cache_key(schema: Any) -> str | None:
+        """Key *schema* by its sorted-key serialization, or return None if it can't be serialized."""
+        try:
+            return json.dumps(schema, sort_keys=True, default=dict)
+        except (TypeError, ValueError):
+            return None
+
+    def _convert_uncached(self, schema: dict[str, Any]) -> dict[str, Any]:
+        """Convert a schema without consulting the cache."""
         # Make a deep copy to avoid modifying the original
-        schema = copy.deepcopy(schema)
+        schema = _copy_schema(schema)
 
         # Handle empty schema
         if not schema:
@@ -70,21 +135,17 @@ class SchemaConverter:
 
         return schema
 
-    def _inline_refs(
-        self,
-        schema: dict[str, Any],
-        defs: dict[str, Any],
-        _seen: set[str] | None = None,
-        _depth: int = 0,
-    ) -> dict[str, Any]:
-        """Recursively inline all $ref references, removing $defs.
+    def _inline_refs(self, schema: dict[str, Any], defs: dict[str, Any]) -> dict[str, Any]:
+        """Inline all $ref references, removing $defs.
+
+        Walks the schema with an explicit stack instead of recursing, so
+        each nested container costs a loop iteration rather than a Python
+        call. Each stack entry carries the $ref paths resolved on its own
+        branch (for cycle detection) and its nesting depth.
 
         Args:
             schema: Schema dict that may contain $refs
             defs: Dictionary of definitions from $defs
-            _seen: Internal set tracking visited $ref paths to prevent
-                infinite recursion on circular references.
-            _depth: Current recursion depth for safety limit.
 
         Returns:
             Schema with all $refs replaced by their definitions
@@ -92,37 +153,62 @@ class SchemaConverter:
         Raises:
             ValueError: If a circular $ref is detected or depth exceeds limit.
         """
-        if _depth > _MAX_REF_DEPTH:
-            raise ValueError(f"$ref resolution exceeded maximum depth of {_MAX_REF_DEPTH}")
-
-        if _seen is None:
-            _seen = set()
-
-        if isinstance(schema, dict):
-            # If this is a $ref, resolve it
-            if "$ref" in schema:
-                ref_path = schema["$ref"]
-                if ref_path in _seen:
-                    raise ValueError(f"Circular $ref detected: {ref_path}")
-                _seen = _seen | {ref_path}
-                resolved = self._resolve_ref(ref_path, defs)
-                # Recursively inline refs in the resolved schema
-                return self._inline_refs(resolved, defs, _seen, _depth + 1)
-
-            # Otherwise, recursively process all values
-            result = {}
-            for key, value in schema.items():
-                if key == "$defs":
-                    # Skip $defs, we'll remove it later
+        root: list[Any] = [None]
+        # (container, refs seen on this branch, depth, parent container, slot in parent).
+        # Only dicts and lists are pushed; primitive leaves are copied in place.
+        stack: list[tuple[Any, frozenset[str], int, Any, Any]] = [(schema, frozenset(), 0, root, 0)]
+        push = stack.append
+        pop = stack.pop
+        containers = (dict, list)
+
+        while stack:
+            node, seen, depth, parent, slot = pop()
+            child_depth = depth + 1
+
+            if isinstance(node, dict):
+                # A $ref node is replaced by its resolved definition
+                if "$ref" in node:
+                    ref_path = node["$ref"]
+                    if ref_path in seen:
+                        raise ValueError(f"Circular $ref detected: {ref_path}")
+                    resolved = self._resolve_ref(ref_path, defs)
+                    if child_depth > _MAX_REF_DEPTH:
+                        raise ValueError(f"$ref resolution exceeded maximum depth of {_MAX_REF_DEPTH}")
+                    if isinstance(resolved, containers):
+                        push((resolved, seen | {ref_path}, child_depth, parent, slot))
+                    else:
+                        parent[slot] = resolved
                     continue
-                result[key] = self._inline_refs(value, defs, _seen, _depth + 1)
-            return result
-        elif isinstance(schema, list):
-            # Recursively process list items
-            return [self._inline_refs(item, defs, _seen, _depth + 1) for item in schema]
-        else:
-            # Primitive value, return as-is
-            return schema
+
+                # Skip nested $defs; the root one is removed by the caller
+                out: dict[str, Any] = {}
+                pending: list[tuple[Any, frozenset[str], int, Any, Any]] = []
+                for key, value in node.items():
+                    if key == "$defs":
+                        continue
+                    out[key] = value
+                    if isinstance(value, containers):
+                        pending.append((value, seen, child_depth, out, key))
+                if out and child_depth > _MAX_REF_DEPTH:
+                    raise ValueError(f"$ref resolution exceeded maximum depth of {_MAX_REF_DEPTH}")
+                parent[slot] = out
+            else:
+                items = list(node)
+                pending = [
+                    (value, seen, child_depth, items, index)
+                    for index, value in enumerate(node)
+                    if isinstance(value, containers)
+                ]
+                if items and child_depth > _MAX_REF_DEPTH:
+                    raise ValueError(f"$ref resolution exceeded maximum depth of {_MAX_REF_DEPTH}")
+                parent[slot] = items
+
+            # Reversed so children are visited, and errors raised, in document order
+            pending.reverse()
+            stack.extend(pending)
+
+        result: dict[str, Any] = root[0]
+        return result
 
     def _resolve_ref(self, ref_path: str, defs: dict[str, Any]) -> dict[str, Any]:
         """Resolve a single $ref path against $defs.
@@ -132,7 +218,9 @@ class SchemaConverter:
             defs: Dictionary of definitions
 
         Returns:
-            The resolved schema definition (deep copy)
+            The resolved schema definition itself, not a copy;
+            ``_inline_refs`` rebuilds every container it visits, so the
+            definition is never mutated or aliased by the output.
 
         Raises:
             ValueError: If the $ref path is invalid or not found
@@ -148,8 +236,8 @@ class SchemaConverter:
         if def_name not in defs:
             raise KeyError(f"Definition not found: {def_name}")
 
-        # Return a deep copy to avoid circular reference issues
-        return copy.deepcopy(defs[def_name])
+        definition: dict[str, Any] = defs[def_name]
+        return definition
 
     def _ensure_object_type(self, schema: dict[str, Any]) -> dict[str, Any]:
         """Ensure schema has type: object with properties.
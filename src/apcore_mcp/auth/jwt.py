@@ -2,7 +2,9 @@
 
 from __future__ import annotations
 
+import functools
 import logging
+from collections.abc import Callable
 from dataclasses import dataclass
 from typing import Any
 
@@ -14,7 +16,7 @@ from apcore_mcp.auth.protocol import Authenticator
 logger = logging.getLogger(__name__)
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class ClaimMapping:
     """Maps JWT claims to ``Identity`` fields.
 
@@ -60,6 +62,22 @@ class JWTAuthenticator:
         self._claim_mapping = claim_mapping or ClaimMapping()
         self._require_claims: list[str] = require_claims if require_claims is not None else ["sub"]
 
+        # Bind everything except the token once, so each request only
+        # pays for the decode itself.
+        options: dict[str, Any] = {}
+        if self._require_claims:
+            options["require"] = self._require_claims
+        decode_kwargs: dict[str, Any] = {
+            "key": self._key,
+            "algorithms": self._algorithms,
+            "options": options,
+        }
+        if self._audience is not None:
+            decode_kwargs["audience"] = self._audience
+        if self._issuer is not None:
+            decode_kwargs["issuer"] = self._issuer
+        self._decode: Callable[[str], dict[str, Any]] = functools.partial(pyjwt.decode, **decode_kwargs)
+
     def authenticate(self, headers: dict[str, str]) -> Identity | None:
         """Extract Bearer token from headers, decode, and return Identity."""
         auth_header = headers.get("authorization", "")
@@ -79,22 +97,7 @@ class JWTAuthenticator:
     def _decode_token(self, token: str) -> dict[str, Any] | None:
         """Decode and validate a JWT token. Returns None on any error."""
         try:
-            options: dict[str, Any] = {}
-            if self._require_claims:
-                options["require"] = self._require_claims
-
-            kwargs: dict[str, Any] = {
-                "jwt": token,
-                "key": self._key,
-                "algorithms": self._algorithms,
-                "options": options,
-            }
-            if self._audience is not None:
-                kwargs["audience"] = self._audience
-            if self._issuer is not None:
-                kwargs["issuer"] = self._issuer
-
-            return pyjwt.decode(**kwargs)
+            return self._decode(token)
         except pyjwt.InvalidTokenError:
             logger.debug("JWT validation failed", exc_info=True)
             return None
@@ -75,21 +75,17 @@ class AuthMiddleware:
                 identity = self._authenticator.authenticate(headers)
             except Exception:
                 pass
-            token = auth_identity_var.set(identity)
-            try:
-                await self._app(scope, receive, send)
-            finally:
-                auth_identity_var.reset(token)
-            return
+        else:
+            headers = extract_headers(scope)
+            identity = self._authenticator.authenticate(headers)
 
-        headers = extract_headers(scope)
-        identity = self._authenticator.authenticate(headers)
-
-        if identity is None and self._require_auth:
-            logger.warning("Authentication failed for %s", path)
-            await self._send_401(send)
-            return
+            if identity is None and self._require_auth:
+                logger.warning("Authentication failed for %s", path)
+                await self._send_401(send)
+                return
 
+        # Always pair set() with reset(token) so identity never outlives the
+        # request, even when the server copies the context into child tasks.
         token = auth_identity_var.set(identity)
         try:
             await self._app(scope, receive, send)
@@ -2,23 +2,55 @@
 
 from __future__ import annotations
 
+import json
+import threading
+from collections import OrderedDict
 from typing import Any
 
 from apcore.schema.strict import _apply_llm_descriptions, to_strict_schema
 
 from apcore_mcp.adapters.annotations import AnnotationMapper
 from apcore_mcp.adapters.id_normalizer import ModuleIDNormalizer
-from apcore_mcp.adapters.schema import SchemaConverter
+from apcore_mcp.adapters.schema import SchemaConverter, _copy_schema
+
+_TOOL_CACHE_SIZE = 1000
 
 
 class OpenAIConverter:
-    """Converts apcore Registry modules to OpenAI-compatible tool definitions."""
+    """Converts apcore Registry modules to OpenAI-compatible tool definitions.
+
+    Strict-mode definitions are memoized per instance, keyed by module ID,
+    final description, and input schema content, so re-exporting an unchanged
+    registry skips the strict transform. Non-strict definitions are cheaper to
+    build than to look up and are not cached.
+    """
 
     def __init__(self) -> None:
         """Initialize with internal SchemaConverter, AnnotationMapper, and ModuleIDNormalizer."""
         self._schema_converter = SchemaConverter()
         self._annotation_mapper = AnnotationMapper()
         self._id_normalizer = ModuleIDNormalizer()
+        self._cache: OrderedDict[tuple[str, str, str], dict[str, Any]] = OrderedDict()
+        self._cache_lock = threading.Lock()
+
+    def clear_cache(self) -> None:
+        """Drop all memoized tool definitions."""
+        with self._cache_lock:
+            self._cache.clear()
+
+    def render_name(self, descriptor: Any) -> str:
+        """Return the OpenAI function name for a descriptor.
+
+        Cheap alternative to convert_descriptor() when only the name is needed;
+        skips schema conversion and description building.
+
+        Args:
+            descriptor: ModuleDescriptor with a module_id attribute.
+
+        Returns:
+            Normalized function name (e.g., "image-resize" for "image.resize").
+        """
+        return self._id_normalizer.normalize(descriptor.module_id)
 
     def convert_registry(
         self,
@@ -87,9 +119,6 @@ class OpenAIConverter:
                 }
             }
         """
-        name = self._id_normalizer.normalize(descriptor.module_id)
-        parameters = self._schema_converter.convert_input_schema(descriptor)
-
         # Build description with optional annotation suffix
         description = descriptor.description
         if embed_annotations:
@@ -98,8 +127,41 @@ class OpenAIConverter:
             )
             description += suffix
 
+        if not strict:
+            return self._build_tool(descriptor, description, strict)
+
+        # Strict results are memoized by content; schemas that can't be
+        # serialized to a key are converted on every call. Read-only mappings
+        # serialize like the dicts they wrap.
+        try:
+            schema_key = json.dumps(descriptor.input_schema, sort_keys=True, default=dict)
+        except (TypeError, ValueError):
+            return self._build_tool(descriptor, description, strict)
+
+        key = (descriptor.module_id, description, schema_key)
+        with self._cache_lock:
+            tool = self._cache.get(key)
+            if tool is not None:
+                self._cache.move_to_end(key)
+        if tool is None:
+            tool = self._build_tool(descriptor, description, strict)
+            with self._cache_lock:
+                self._cache[key] = tool
+                if len(self._cache) > _TOOL_CACHE_SIZE:
+                    self._cache.popitem(last=False)
+        # Hand out copies so callers can't corrupt the cached definition.
+        # Tool definitions are plain JSON data, so a structural copy suffices.
+        result: dict[str, Any] = _copy_schema(tool)
+        return result
+
+    def _build_tool(self, descriptor: Any, description: str, strict: bool) -> dict[str, Any]:
+        """Build the OpenAI tool definition for a descriptor (uncached)."""
+        name = self.render_name(descriptor)
+        parameters = self._schema_converter.convert_input_schema(descriptor)
+
         # Apply strict mode transformations if requested
         if strict:
+            # parameters is already a private copy from SchemaConverter.
             parameters = self._apply_strict_mode(parameters)
 
         # Build the function dict
@@ -121,8 +183,9 @@ class OpenAIConverter:
         """Convert schema to OpenAI strict mode via apcore's to_strict_schema().
 
         Steps:
-        1. Deep-copies the input (done by to_strict_schema)
-        2. Promotes x-llm-description to description (before stripping)
+        1. Promotes x-llm-description to description in place (callers pass
+           a schema they own, so no defensive copy is made here)
+        2. Deep-copies the promoted schema (done by to_strict_schema)
         3. Strips x-* extensions and default values
         4. Sets additionalProperties: false on all objects
         5. Makes all properties required (sorted alphabetically)
@@ -132,13 +195,11 @@ class OpenAIConverter:
         This matches the behavior of SchemaExporter.export_openai().
 
         Args:
-            schema: JSON Schema dict to transform.
+            schema: JSON Schema dict to transform; its descriptions may be
+                rewritten in place.
 
         Returns:
             New schema dict with strict mode applied.
         """
-        import copy
-
-        schema = copy.deepcopy(schema)
         _apply_llm_descriptions(schema)
         return to_strict_schema(schema)
@@ -69,12 +69,15 @@ def build_explorer_routes(
         List of Starlette Route objects to be mounted under the explorer prefix.
     """
     tools_by_name: dict[str, Any] = {t.name: t for t in tools}
+    # Tools are fixed for the lifetime of the mount, so the list endpoint
+    # body is serialized once here instead of on every request.
+    tools_list_body = JSONResponse([_tool_summary(t) for t in tools]).body
 
     async def explorer_page(request: Request) -> HTMLResponse:
         return HTMLResponse(_EXPLORER_HTML)
 
-    async def list_tools(request: Request) -> JSONResponse:
-        return JSONResponse([_tool_summary(t) for t in tools])
+    async def list_tools(request: Request) -> Response:
+        return Response(tools_list_body, media_type="application/json")
 
     async def tool_detail(request: Request) -> Response:
         name = request.path_params["name"]
@@ -17,6 +17,10 @@ logger = logging.getLogger(__name__)
 
 _DEEP_MERGE_MAX_DEPTH = 32
 
+# json.dumps(obj, default=str) builds a new JSONEncoder on every call; this
+# shared instance produces identical output without the per-call setup.
+_RESULT_ENCODER = json.JSONEncoder(default=str)
+
 
 def _deep_merge(base: dict[str, Any], overlay: dict[str, Any], depth: int = 0) -> dict[str, Any]:
     """Recursively merge *overlay* into *base*, capped at ``_DEEP_MERGE_MAX_DEPTH``.
@@ -232,7 +236,7 @@ class ExecutionRouter:
                 result = await self._executor.call_async(tool_name, arguments, context)
             else:
                 result = await self._executor.call_async(tool_name, arguments)
-            json_output = json.dumps(result, default=str)
+            json_output = _RESULT_ENCODER.encode(result)
             content: list[dict[str, str]] = [{"type": "text", "text": json_output}]
             trace_id = context.trace_id if context is not None else None
             return (content, False, trace_id)
@@ -272,7 +276,7 @@ class ExecutionRouter:
                         "progressToken": progress_token,
                         "progress": chunk_index + 1,
                         "total": None,
-                        "message": json.dumps(chunk, default=str),
+                        "message": _RESULT_ENCODER.encode(chunk),
                     },
                 }
                 await send_notification(notification)
@@ -281,7 +285,7 @@ class ExecutionRouter:
                 accumulated = _deep_merge(accumulated, chunk)
                 chunk_index += 1
 
-            json_output = json.dumps(accumulated, default=str)
+            json_output = _RESULT_ENCODER.encode(accumulated)
             content: list[dict[str, str]] = [{"type": "text", "text": json_output}]
             trace_id = context.trace_id if context is not None else None
             return (content, False, trace_id)
@@ -2,6 +2,9 @@
 
 from __future__ import annotations
 
+import json
+from types import MappingProxyType, SimpleNamespace
+
 import pytest
 
 from apcore_mcp.adapters.schema import SchemaConverter
@@ -211,6 +214,24 @@ class TestSchemaConverter:
         # Verify it's a deep copy, not the same object
         assert result is not simple_descriptor.input_schema
 
+    def test_read_only_schema_is_copied_to_dicts(self, converter):
+        """MappingProxyType schemas are accepted and come back as plain dicts."""
+        from tests.conftest import ModuleDescriptor
+
+        properties = MappingProxyType({"name": MappingProxyType({"type": "string"})})
+        descriptor = ModuleDescriptor(
+            module_id="test.read_only",
+            description="Read-only schema",
+            input_schema=MappingProxyType({"type": "object", "properties": properties, "required": ["name"]}),
+            output_schema={},
+        )
+
+        result = converter.convert_input_schema(descriptor)
+
+        assert result == {"type": "object", "properties": {"name": {"type": "string"}}, "required": ["name"]}
+        assert type(result["properties"]["name"]) is dict
+        assert result["required"] is not descriptor.input_schema["required"]
+
     def test_circular_ref_raises_value_error(self, converter):
         """Test that circular $ref raises ValueError."""
         from tests.conftest import ModuleDescriptor
@@ -278,6 +299,32 @@ class TestSchemaConverter:
         with pytest.raises(KeyError, match="Definition not found"):
             converter.convert_input_schema(descriptor)
 
+    def test_repeated_ref_inlines_independent_copies(self, converter):
+        """Test that each use of a definition gets its own copy and $defs is untouched."""
+        item = {"type": "object", "properties": {"tags": {"type": "array", "items": {"type": "string"}}}}
+        schema = {
+            "type": "object",
+            "$defs": {"Item": item},
+            "properties": {"a": {"$ref": "#/$defs/Item"}, "b": {"$ref": "#/$defs/Item"}},
+        }
+
+        result = converter._inline_refs(schema, schema["$defs"])
+
+        assert result["properties"]["a"] == item
+        assert result["properties"]["a"] is not result["properties"]["b"]
+        result["properties"]["a"]["properties"]["tags"]["items"]["type"] = "integer"
+        assert result["properties"]["b"]["properties"]["tags"]["items"]["type"] == "string"
+        assert item["properties"]["tags"]["items"]["type"] == "string"
+
+    def test_ref_nesting_beyond_max_depth_raises(self, converter):
+        """Test that $ref chains nested past the depth limit raise ValueError."""
+        defs = {f"D{i}": {"type": "object", "properties": {"next": {"$ref": f"#/$defs/D{i + 1}"}}} for i in range(40)}
+        defs["D40"] = {"type": "string"}
+        schema = {"type": "object", "$defs": defs, "properties": {"root": {"$ref": "#/$defs/D0"}}}
+
+        with pytest.raises(ValueError, match="exceeded maximum depth"):
+            converter._convert_schema(schema)
+
     def test_schema_with_list_items(self, converter):
         """Test that list values in schemas are handled correctly."""
         from tests.conftest import ModuleDescriptor
@@ -331,3 +378,63 @@ class TestSchemaConverter:
 
         result = converter.convert_input_schema(descriptor)
         assert result["type"] == "object"
+
+
+class TestSchemaConversionCache:
+    """Memoization of $defs-bearing schema conversions."""
+
+    @pytest.fixture
+    def converter(self):
+        return SchemaConverter()
+
+    def test_repeat_conversion_skips_ref_inlining(self, converter, nested_schema_descriptor, monkeypatch):
+        first = converter.convert_input_schema(nested_schema_descriptor)
+
+        def fail(*args, **kwargs):
+            raise AssertionError("$refs inlined again for a cached schema")
+
+        monkeypatch.setattr(converter, "_inline_refs", fail)
+        assert converter.convert_input_schema(nested_schema_descriptor) == first
+
+    def test_cached_result_is_a_private_copy(self, converter, nested_schema_descriptor):
+        first = converter.convert_input_schema(nested_schema_descriptor)
+        first["properties"]["steps"]["items"]["properties"].clear()
+
+        second = converter.convert_input_schema(nested_schema_descriptor)
+        assert second is not first
+        assert "name" in second["properties"]["steps"]["items"]["properties"]
+
+    def test_equal_schemas_share_an_entry(self, converter, nested_schema_descriptor):
+        from tests.conftest import ModuleDescriptor
+
+        twin = ModuleDescriptor(
+            module_id="workflow.twin",
+            description="Same schema, different module",
+            input_schema=json.loads(json.dumps(nested_schema_descriptor.input_schema)),
+            output_schema={},
+        )
+        converter.convert_input_schema(nested_schema_descriptor)
+        converter.convert_input_schema(twin)
+        assert len(converter._cache) == 1
+
+    def test_schemas_without_defs_are_not_cached(self, converter, simple_descriptor):
+        converter.convert_input_schema(simple_descriptor)
+        assert len(converter._cache) == 0
+
+    def test_equal_schema_on_plain_descriptor_is_a_cache_hit(self, converter, nested_schema_descriptor, monkeypatch):
+        converter.convert_input_schema(nested_schema_descriptor)
+        # A bare object with only input_schema, like any duck-typed descriptor
+        descriptor = SimpleNamespace(input_schema=json.loads(json.dumps(nested_schema_descriptor.input_schema)))
+
+        def fail(schema):
+            raise AssertionError("equal schema converted again")
+
+        monkeypatch.setattr(converter, "_convert_uncached", fail)
+        result = converter.convert_input_schema(descriptor)
+        assert result["properties"]["steps"]["items"]["properties"]["name"] == {"type": "string"}
+        assert list(converter._cache) == [converter._cache_key(descriptor.input_schema)]
+
+    def test_clear_cache(self, converter, nested_schema_descriptor):
+        converter.convert_input_schema(nested_schema_descriptor)
+        converter.clear_cache()
+        assert len(converter._cache) == 0
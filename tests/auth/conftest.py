@@ -0,0 +1,39 @@
+"""Shared fixtures for auth tests."""
+
+from __future__ import annotations
+
+from collections.abc import Iterator
+from typing import Any
+
+import pytest
+
+from apcore_mcp.auth.middleware import auth_identity_var
+
+
+@pytest.fixture(autouse=True)
+def _reset_identity_var() -> Iterator[None]:
+    """Start every auth test with no identity and restore the previous value afterwards."""
+    token = auth_identity_var.set(None)
+    yield
+    auth_identity_var.reset(token)
+
+
+async def _noop(*_args: Any, **_kwargs: Any) -> None:
+    """No-op stand-in for ASGI callables (receive, send, or app) that tests never inspect."""
+
+
+class SendCapture:
+    """ASGI ``send`` callable that records every message it receives."""
+
+    __slots__ = ("sent",)
+
+    def __init__(self) -> None:
+        self.sent: list[dict[str, Any]] = []
+
+    async def __call__(self, message: dict[str, Any]) -> None:
+        self.sent.append(message)
+
+
+@pytest.fixture
+def capture() -> SendCapture:
+    return SendCapture()
@@ -7,13 +7,15 @@ Verifies the full auth pipeline:
 from __future__ import annotations
 
 import json
-from dataclasses import dataclass
+from collections.abc import Callable
+from types import SimpleNamespace
 from typing import Any
 from unittest.mock import AsyncMock
 
-import jwt as pyjwt
 import pytest
 from apcore import Executor, Identity, Registry
+from jwt.algorithms import get_default_algorithms
+from jwt.utils import base64url_encode
 from starlette.applications import Starlette
 from starlette.middleware import Middleware
 from starlette.testclient import TestClient
@@ -23,21 +25,58 @@ from apcore_mcp.auth.middleware import AuthMiddleware, auth_identity_var
 from apcore_mcp.explorer import create_explorer_mount
 from apcore_mcp.server.factory import MCPServerFactory
 from apcore_mcp.server.router import ExecutionRouter
+from tests.auth.conftest import SendCapture, _noop
 
 SECRET = "integration-test-secret-32bytes!"
 EXTENSIONS_DIR = "./examples/extensions"
+_HTTP_MCP_SCOPE_BASE: dict[str, Any] = {"type": "http", "path": "/mcp"}
 
 
-def _make_token(payload: dict, key: str = SECRET) -> str:
-    return pyjwt.encode(payload, key, algorithm="HS256")
+# Resolve the HS256 algorithm and prepare the signing key once; _make_token
+# then only serializes the payload and signs it.
+_HS256 = get_default_algorithms()["HS256"]
+_SIGNING_KEY = _HS256.prepare_key(SECRET)
+_JWT_HEADER_SEGMENT = base64url_encode(b'{"alg":"HS256","typ":"JWT"}')
+
+
+def _make_token(payload: dict) -> str:
+    signing_input = _JWT_HEADER_SEGMENT + b"." + base64url_encode(json.dumps(payload, separators=(",", ":")).encode())
+    return (signing_input + b"." + base64url_encode(_HS256.sign(signing_input, _SIGNING_KEY))).decode()
+
+
+def _result(content: list[dict[str, Any]]) -> Any:
+    """Decode the JSON payload of a router result's first text content item."""
+    return json.loads(content[0]["text"])
+
+
+def _auth_header(payload: dict) -> tuple[bytes, bytes]:
+    return (b"authorization", b"Bearer " + _make_token(payload).encode("ascii"))
+
+
+# Signed and encoded once at import; tests drop these straight into scopes.
+AUTH_HEADER_USER99 = _auth_header({"sub": "user-99", "roles": ["admin"]})
+AUTH_HEADER_USER1 = _auth_header({"sub": "user-1"})
+AUTH_HEADER_API_CLIENT = _auth_header({"sub": "api-client-1", "type": "service", "roles": ["tool-caller"]})
+AUTH_HEADER_EXPIRED = _auth_header({"sub": "user-1", "exp": 1})
+AUTH_HEADER_WS_USER = _auth_header({"sub": "ws-user"})
+EXPLORER_USER_AUTHORIZATION = "Bearer " + _make_token({"sub": "explorer-user", "roles": ["viewer"]})
+
+
+def _build_scope(auth_header: tuple[bytes, bytes] | None = None, **overrides: Any) -> dict[str, Any]:
+    """Build an ASGI scope for /mcp, carrying *auth_header* when given."""
+    headers = [auth_header] if auth_header else []
+    return {**_HTTP_MCP_SCOPE_BASE, "headers": headers, **overrides}
 
 
 # ---------------------------------------------------------------------------
 # Fixtures: real apcore Registry + Executor from examples/
+#
+# Session-scoped: discovery walks and imports examples/extensions, and none of
+# the tests mutate the registry, executor, router, or authenticator.
 # ---------------------------------------------------------------------------
 
 
-@pytest.fixture
+@pytest.fixture(scope="session")
 def registry() -> Registry:
     reg = Registry(extensions_dir=EXTENSIONS_DIR)
     count = reg.discover()
@@ -45,22 +84,29 @@ def registry() -> Registry:
     return reg
 
 
-@pytest.fixture
+@pytest.fixture(scope="session")
 def executor(registry: Registry) -> Executor:
     return Executor(registry)
 
 
-@pytest.fixture
+@pytest.fixture(scope="session")
 def router(executor: Executor) -> ExecutionRouter:
     return ExecutionRouter(executor)
 
 
-@pytest.fixture
-def factory() -> MCPServerFactory:
-    return MCPServerFactory()
+@pytest.fixture(scope="session", autouse=True)
+async def _warm_router(router: ExecutionRouter) -> None:
+    """Call each example tool once up front so first-call costs stay out of individual tests."""
+    for tool, arguments in (
+        ("text_echo", {"text": "x"}),
+        ("math_calc", {"a": 1, "b": 1, "op": "add"}),
+        ("greeting", {"name": "x"}),
+    ):
+        _, is_error, _ = await router.handle_call(tool, arguments)
+        assert is_error is False, f"Warm-up call to {tool} failed"
 
 
-@pytest.fixture
+@pytest.fixture(scope="session")
 def authenticator() -> JWTAuthenticator:
     return JWTAuthenticator(key=SECRET)
 
@@ -82,8 +128,7 @@ class TestRouterIdentityInjection:
             extra={"identity": identity},
         )
         assert is_error is False
-        parsed = json.loads(content[0]["text"])
-        assert parsed["echoed"] == "hello"
+        assert _result(content)["echoed"] == "hello"
 
     async def test_call_without_identity_succeeds(self, router: ExecutionRouter) -> None:
         """Calling a real tool without identity still works (backward compat)."""
@@ -92,8 +137,7 @@ class TestRouterIdentityInjection:
             {"text": "world"},
         )
         assert is_error is False
-        parsed = json.loads(content[0]["text"])
-        assert parsed["echoed"] == "world"
+        assert _result(content)["echoed"] == "world"
 
     async def test_identity_roles_preserved(self, router: ExecutionRouter) -> None:
         """Identity roles survive through the extra → Context pipeline."""
@@ -104,8 +148,7 @@ class TestRouterIdentityInjection:
             extra={"identity": identity},
         )
         assert is_error is False
-        parsed = json.loads(content[0]["text"])
-        assert parsed["result"] == 13
+        assert _result(content)["result"] == 13
 
 
 # ---------------------------------------------------------------------------
@@ -118,35 +161,51 @@ class TestMiddlewareContextVarBridge:
 
     async def test_contextvar_set_during_authenticated_request(self, authenticator: JWTAuthenticator) -> None:
         """Valid JWT sets auth_identity_var visible to downstream ASGI app."""
-        captured: list[Identity | None] = []
+        captured: Identity | None = None
 
         async def downstream(scope: Any, receive: Any, send: Any) -> None:
-            captured.append(auth_identity_var.get())
+            nonlocal captured
+            captured = auth_identity_var.get()
 
         mw = AuthMiddleware(downstream, authenticator)
-        token = _make_token({"sub": "user-99", "roles": ["admin"]})
-        scope = {
-            "type": "http",
-            "path": "/mcp",
-            "headers": [(b"authorization", f"Bearer {token}".encode())],
-        }
-        await mw(scope, AsyncMock(), AsyncMock())
+        scope = _build_scope(AUTH_HEADER_USER99)
+        await mw(scope, _noop, _noop)
 
-        assert captured[0] is not None
-        assert captured[0].id == "user-99"
-        assert captured[0].roles == ("admin",)
+        assert captured is not None
+        assert captured.id == "user-99"
+        assert captured.roles == ("admin",)
 
     async def test_contextvar_none_without_token(self, authenticator: JWTAuthenticator) -> None:
         """Permissive mode: no token → identity is None in ContextVar."""
+        reached = False
+        captured: Identity | None = None
+
+        async def downstream(scope: Any, receive: Any, send: Any) -> None:
+            nonlocal reached, captured
+            reached = True
+            captured = auth_identity_var.get()
+
+        mw = AuthMiddleware(downstream, authenticator, require_auth=False)
+        scope = _build_scope()
+        await mw(scope, _noop, _noop)
+        assert reached
+        assert captured is None
+
+    async def test_contextvar_does_not_leak_between_requests(self, authenticator: JWTAuthenticator) -> None:
+        """Identity from one request is reset before the next one runs."""
         captured: list[Identity | None] = []
 
         async def downstream(scope: Any, receive: Any, send: Any) -> None:
             captured.append(auth_identity_var.get())
 
-        mw = AuthMiddleware(downstream, authenticator, require_auth=False)
-        scope = {"type": "http", "path": "/mcp", "headers": []}
-        await mw(scope, AsyncMock(), AsyncMock())
-        assert captured[0] is None
+        mw = AuthMiddleware(downstream, authenticator)
+        await mw(_build_scope(AUTH_HEADER_USER1), _noop, _noop)
+        assert auth_identity_var.get() is None, "identity was not reset after the first request"
+
+        await mw(_build_scope(AUTH_HEADER_USER99), _noop, _noop)
+
+        assert [identity.id if identity else None for identity in captured] == ["user-1", "user-99"]
+        assert auth_identity_var.get() is None
 
 
 # ---------------------------------------------------------------------------
@@ -162,20 +221,16 @@ class TestFullAuthPipeline:
     ) -> None:
         """Simulate the full auth flow from HTTP header to tool execution result."""
         # Step 1: Middleware sets ContextVar
-        token = _make_token({"sub": "api-client-1", "type": "service", "roles": ["tool-caller"]})
-        scope = {
-            "type": "http",
-            "path": "/mcp",
-            "headers": [(b"authorization", f"Bearer {token}".encode())],
-        }
+        scope = _build_scope(AUTH_HEADER_API_CLIENT)
 
         # Simulate middleware setting ContextVar, then calling handle_call
-        captured_identity: list[Identity | None] = []
+        captured_identity: Identity | None = None
 
         async def app_handler(scope: Any, receive: Any, send: Any) -> None:
+            nonlocal captured_identity
             # This is what factory.py does: read ContextVar
             identity = auth_identity_var.get()
-            captured_identity.append(identity)
+            captured_identity = identity
 
             # This is what router.py does: pass identity via extra
             content, is_error, _ = await router.handle_call(
@@ -184,96 +239,66 @@ class TestFullAuthPipeline:
                 extra={"identity": identity} if identity else None,
             )
             assert is_error is False
-            parsed = json.loads(content[0]["text"])
-            assert "Alice" in parsed["message"]
+            assert "Alice" in _result(content)["message"]
 
         mw = AuthMiddleware(app_handler, authenticator)
-        await mw(scope, AsyncMock(), AsyncMock())
+        await mw(scope, _noop, _noop)
 
         # Verify identity was available throughout
-        assert captured_identity[0] is not None
-        assert captured_identity[0].id == "api-client-1"
-        assert captured_identity[0].type == "service"
-        assert captured_identity[0].roles == ("tool-caller",)
+        assert captured_identity is not None
+        assert captured_identity.id == "api-client-1"
+        assert captured_identity.type == "service"
+        assert captured_identity.roles == ("tool-caller",)
 
-    async def test_unauthenticated_request_rejected(self, authenticator: JWTAuthenticator) -> None:
+    async def test_unauthenticated_request_rejected(
+        self, authenticator: JWTAuthenticator, capture: SendCapture
+    ) -> None:
         """Request without token gets 401, tool never executes."""
         app = AsyncMock()
         mw = AuthMiddleware(app, authenticator)
-        sent: list[dict] = []
-
-        async def capture_send(msg: dict) -> None:
-            sent.append(msg)
 
-        scope = {"type": "http", "path": "/mcp", "headers": []}
-        await mw(scope, AsyncMock(), capture_send)
+        scope = _build_scope()
+        await mw(scope, _noop, capture)
 
-        assert sent[0]["status"] == 401
+        assert capture.sent[0]["status"] == 401
         app.assert_not_called()
 
     async def test_health_endpoint_bypasses_auth(self, authenticator: JWTAuthenticator) -> None:
         """Health endpoint is exempt from auth even without token."""
         app = AsyncMock()
         mw = AuthMiddleware(app, authenticator)
-        scope = {"type": "http", "path": "/health", "headers": []}
-        await mw(scope, AsyncMock(), AsyncMock())
+        scope = _build_scope(path="/health")
+        await mw(scope, _noop, _noop)
         app.assert_called_once()
 
-    async def test_expired_token_rejected(self, router: ExecutionRouter, authenticator: JWTAuthenticator) -> None:
+    async def test_expired_token_rejected(self, authenticator: JWTAuthenticator, capture: SendCapture) -> None:
         """Expired token gets 401."""
-        import time
-
-        token = _make_token({"sub": "user-1", "exp": int(time.time()) - 60})
-        sent: list[dict] = []
-
-        async def capture_send(msg: dict) -> None:
-            sent.append(msg)
-
         app = AsyncMock()
         mw = AuthMiddleware(app, authenticator)
-        scope = {
-            "type": "http",
-            "path": "/mcp",
-            "headers": [(b"authorization", f"Bearer {token}".encode())],
-        }
-        await mw(scope, AsyncMock(), capture_send)
-        assert sent[0]["status"] == 401
+        scope = _build_scope(AUTH_HEADER_EXPIRED)
+        await mw(scope, _noop, capture)
+        assert capture.sent[0]["status"] == 401
         app.assert_not_called()
 
+    @pytest.mark.parametrize("auth_header", [None, AUTH_HEADER_WS_USER], ids=["no_token", "valid_token"])
     async def test_websocket_scope_bypasses_auth(
-        self, router: ExecutionRouter, authenticator: JWTAuthenticator
+        self, authenticator: JWTAuthenticator, auth_header: tuple[bytes, bytes] | None
     ) -> None:
-        """WebSocket scope passes through without auth — no token required."""
-        executed = False
-
-        async def app_handler(scope: Any, receive: Any, send: Any) -> None:
-            nonlocal executed
-            # Verify ContextVar is NOT set (middleware skips non-HTTP scopes)
-            assert auth_identity_var.get() is None
-            executed = True
-
-        mw = AuthMiddleware(app_handler, authenticator)
-        scope = {"type": "websocket", "path": "/mcp", "headers": []}
-        await mw(scope, AsyncMock(), AsyncMock())
-        assert executed, "WebSocket request should have reached the app"
-
-    async def test_websocket_scope_does_not_set_identity(self, authenticator: JWTAuthenticator) -> None:
-        """Even with a valid token in headers, WebSocket scope does not set identity."""
-        captured: list[Identity | None] = []
+        """WebSocket scope reaches the app without auth and never sets identity, even with a valid token."""
+        reached = False
+        captured: Identity | None = None
 
         async def app_handler(scope: Any, receive: Any, send: Any) -> None:
-            captured.append(auth_identity_var.get())
+            nonlocal reached, captured
+            reached = True
+            captured = auth_identity_var.get()
 
-        token = _make_token({"sub": "ws-user"})
         mw = AuthMiddleware(app_handler, authenticator)
-        scope = {
-            "type": "websocket",
-            "path": "/mcp",
-            "headers": [(b"authorization", f"Bearer {token}".encode())],
-        }
-        await mw(scope, AsyncMock(), AsyncMock())
+        scope = _build_scope(auth_header, type="websocket")
+        await mw(scope, _noop, _noop)
+        assert reached, "WebSocket request should have reached the app"
         # Identity should NOT be set — middleware skips non-HTTP scopes entirely
-        assert captured[0] is None
+        assert captured is None
 
 
 # ---------------------------------------------------------------------------
@@ -293,63 +318,49 @@ class TestBuildToolsWithAuth:
         assert "math_calc" in tool_names
         assert "text_echo" in tool_names
 
-    async def test_authenticated_execution_of_each_tool(self, router: ExecutionRouter) -> None:
+    @pytest.mark.parametrize(
+        "tool,arguments,check",
+        [
+            ("greeting", {"name": "Bob"}, lambda parsed: "Bob" in parsed["message"]),
+            ("math_calc", {"a": 6, "b": 7, "op": "mul"}, lambda parsed: parsed["result"] == 42),
+            ("text_echo", {"text": "echo me", "uppercase": True}, lambda parsed: parsed["echoed"] == "ECHO ME"),
+        ],
+        ids=["greeting", "math_calc", "text_echo"],
+    )
+    async def test_authenticated_execution_of_each_tool(
+        self,
+        router: ExecutionRouter,
+        tool: str,
+        arguments: dict[str, Any],
+        check: Callable[[dict[str, Any]], bool],
+    ) -> None:
         """Each real tool executes successfully with an identity in context."""
         identity = Identity(id="tester", type="user", roles=("admin",))
-        extra = {"identity": identity}
-
-        # greeting
-        content, is_error, _ = await router.handle_call("greeting", {"name": "Bob"}, extra=extra)
-        assert is_error is False
-        assert "Bob" in json.loads(content[0]["text"])["message"]
-
-        # math_calc
-        content, is_error, _ = await router.handle_call("math_calc", {"a": 6, "b": 7, "op": "mul"}, extra=extra)
-        assert is_error is False
-        assert json.loads(content[0]["text"])["result"] == 42
-
-        # text_echo
-        content, is_error, _ = await router.handle_call(
-            "text_echo", {"text": "echo me", "uppercase": True}, extra=extra
-        )
+        content, is_error, _ = await router.handle_call(tool, arguments, extra={"identity": identity})
         assert is_error is False
-        assert json.loads(content[0]["text"])["echoed"] == "ECHO ME"
+        assert check(_result(content))
 
 
 # ---------------------------------------------------------------------------
-# Mock objects for Explorer integration tests
+# Tool stand-ins for Explorer integration tests
 # ---------------------------------------------------------------------------
 
 
-@dataclass
-class _MockToolAnnotations:
-    readOnlyHint: bool | None = None  # noqa: N815
-    destructiveHint: bool | None = None  # noqa: N815
-    idempotentHint: bool | None = None  # noqa: N815
-    openWorldHint: bool | None = None  # noqa: N815
-    title: str | None = None
-
-    def model_dump(self, **kwargs: Any) -> dict[str, Any]:
-        result = {}
-        if self.readOnlyHint is not None:
-            result["readOnlyHint"] = self.readOnlyHint
-        if self.destructiveHint is not None:
-            result["destructiveHint"] = self.destructiveHint
-        if self.idempotentHint is not None:
-            result["idempotentHint"] = self.idempotentHint
-        if self.openWorldHint is not None:
-            result["openWorldHint"] = self.openWorldHint
-        if self.title is not None:
-            result["title"] = self.title
-        return result
-
-
-@dataclass
-class _MockTool:
-    name: str
-    description: str
-    inputSchema: dict[str, Any]  # noqa: N815
-    annotations: _MockToolAnnotations | None = None
+def _explorer_tool(annotations: dict[str, Any] | None = None) -> SimpleNamespace:
+    """Build an MCP Tool stand-in with plain-dict annotations (no model_dump needed)."""
+    return SimpleNamespace(
+        name="image.resize",
+        description="Resize an image",
+        inputSchema={
+            "type": "object",
+            "properties": {
+                "width": {"type": "integer"},
+                "height": {"type": "integer"},
+            },
+            "required": ["width", "height"],
+        },
+        annotations=annotations,
+    )
 
 
 # ---------------------------------------------------------------------------
@@ -367,21 +378,7 @@ class TestExplorerAuthIntegration:
         exempt_paths: set[str] | None = None,
     ) -> Starlette:
         """Build a Starlette app with auth middleware and explorer mount."""
-        tools = [
-            _MockTool(
-                name="image.resize",
-                description="Resize an image",
-                inputSchema={
-                    "type": "object",
-                    "properties": {
-                        "width": {"type": "integer"},
-                        "height": {"type": "integer"},
-                    },
-                    "required": ["width", "height"],
-                },
-                annotations=_MockToolAnnotations(readOnlyHint=False),
-            ),
-        ]
+        tools = [_explorer_tool({"readOnlyHint": False})]
         mock_router = AsyncMock()
         mock_router.handle_call.return_value = (
             [{"type": "text", "text": '{"result": "ok"}'}],
@@ -408,19 +405,17 @@ class TestExplorerAuthIntegration:
         )
         return app
 
-    def test_get_explorer_page_bypasses_auth(self) -> None:
+    def test_get_explorer_page_bypasses_auth(self, authenticator: JWTAuthenticator) -> None:
         """TC-AUTH-INT-014: Explorer GET /explorer/ bypasses auth."""
-        auth = JWTAuthenticator(key=SECRET)
-        app = self._build_app(auth)
+        app = self._build_app(authenticator)
         client = TestClient(app, raise_server_exceptions=False)
         response = client.get("/explorer/")
         assert response.status_code == 200
         assert "text/html" in response.headers["content-type"]
 
-    def test_get_explorer_tools_bypasses_auth(self) -> None:
+    def test_get_explorer_tools_bypasses_auth(self, authenticator: JWTAuthenticator) -> None:
         """TC-AUTH-INT-015: Explorer GET /explorer/tools bypasses auth."""
-        auth = JWTAuthenticator(key=SECRET)
-        app = self._build_app(auth)
+        app = self._build_app(authenticator)
         client = TestClient(app, raise_server_exceptions=False)
         response = client.get("/explorer/tools")
         assert response.status_code == 200
@@ -428,10 +423,9 @@ class TestExplorerAuthIntegration:
         assert isinstance(data, list)
         assert len(data) == 1
 
-    def test_post_call_returns_401_without_token(self) -> None:
+    def test_post_call_returns_401_without_token(self, authenticator: JWTAuthenticator) -> None:
         """TC-AUTH-INT-016: Explorer POST /call returns 401 without token."""
-        auth = JWTAuthenticator(key=SECRET)
-        app = self._build_app(auth)
+        app = self._build_app(authenticator)
         client = TestClient(app, raise_server_exceptions=False)
         response = client.post(
             "/explorer/tools/image.resize/call",
@@ -439,23 +433,9 @@ class TestExplorerAuthIntegration:
         )
         assert response.status_code == 401
 
-    def test_post_call_sets_identity_with_valid_token(self) -> None:
+    def test_post_call_sets_identity_with_valid_token(self, authenticator: JWTAuthenticator) -> None:
         """TC-AUTH-INT-017: Explorer POST /call sets identity with valid token."""
-        auth = JWTAuthenticator(key=SECRET)
-        tools = [
-            _MockTool(
-                name="image.resize",
-                description="Resize an image",
-                inputSchema={
-                    "type": "object",
-                    "properties": {
-                        "width": {"type": "integer"},
-                        "height": {"type": "integer"},
-                    },
-                    "required": ["width", "height"],
-                },
-            ),
-        ]
+        tools = [_explorer_tool()]
         captured_identity: list[Identity | None] = []
         return_value = (
             [{"type": "text", "text": '{"result": "ok"}'}],
@@ -475,20 +455,19 @@ class TestExplorerAuthIntegration:
             mock_router,
             allow_execute=True,
             explorer_prefix="/explorer",
-            authenticator=auth,
+            authenticator=authenticator,
         )
         app = Starlette(
             routes=[mount],
             middleware=[
-                Middleware(AuthMiddleware, authenticator=auth, exempt_prefixes={"/explorer"}),
+                Middleware(AuthMiddleware, authenticator=authenticator, exempt_prefixes={"/explorer"}),
             ],
         )
-        token = _make_token({"sub": "explorer-user", "roles": ["viewer"]})
         client = TestClient(app, raise_server_exceptions=False)
         response = client.post(
             "/explorer/tools/image.resize/call",
             json={"width": 100, "height": 200},
-            headers={"Authorization": f"Bearer {token}"},
+            headers={"Authorization": EXPLORER_USER_AUTHORIZATION},
         )
         assert response.status_code == 200
         assert len(captured_identity) == 1
@@ -496,10 +475,9 @@ class TestExplorerAuthIntegration:
         assert captured_identity[0].id == "explorer-user"
         assert captured_identity[0].roles == ("viewer",)
 
-    def test_explorer_exempt_with_custom_exempt_paths(self) -> None:
+    def test_explorer_exempt_with_custom_exempt_paths(self, authenticator: JWTAuthenticator) -> None:
         """TC-AUTH-INT-018: Explorer exempt even with custom exempt_paths."""
-        auth = JWTAuthenticator(key=SECRET)
-        app = self._build_app(auth, exempt_paths={"/custom-health"})
+        app = self._build_app(authenticator, exempt_paths={"/custom-health"})
         client = TestClient(app, raise_server_exceptions=False)
 
         # Explorer pages should still be accessible (exempt via prefix)
@@ -2,13 +2,10 @@
 
 from __future__ import annotations
 
-import time
-
 import jwt as pyjwt
 import pytest
 
 from apcore_mcp.auth.jwt import ClaimMapping, JWTAuthenticator
-from apcore_mcp.auth.protocol import Authenticator
 
 SECRET = "test-secret-key-that-is-32-bytes!"
 
@@ -17,94 +14,106 @@ def _make_token(payload: dict, key: str = SECRET, algorithm: str = "HS256") -> s
     return pyjwt.encode(payload, key, algorithm=algorithm)
 
 
+# Tokens are signed once at import; each test reuses the constant it needs.
+TOKEN_USER1 = _make_token({"sub": "user-1"})
+TOKEN_WITH_ROLES = _make_token({"sub": "user-2", "roles": ["admin", "editor"]})
+TOKEN_SERVICE = _make_token({"sub": "svc-1", "type": "service"})
+TOKEN_EXPIRED = _make_token({"sub": "user-1", "exp": 1})
+TOKEN_WRONG_KEY = _make_token({"sub": "user-1"}, key="wrong-key-that-is-also-32-bytes!")
+TOKEN_AUD_MY_APP = _make_token({"sub": "user-1", "aud": "my-app"})
+TOKEN_AUD_OTHER_APP = _make_token({"sub": "user-1", "aud": "other-app"})
+TOKEN_ISS_AUTH_SERVER = _make_token({"sub": "user-1", "iss": "auth-server"})
+TOKEN_ISS_BAD = _make_token({"sub": "user-1", "iss": "bad-issuer"})
+TOKEN_CUSTOM_ID = _make_token({"user_id": "custom-1"})
+TOKEN_PERMISSIONS = _make_token({"sub": "u1", "permissions": ["read", "write"]})
+TOKEN_EMAIL_ORG = _make_token({"sub": "u1", "email": "a@b.com", "org": "acme"})
+TOKEN_EMAIL = _make_token({"sub": "u1", "email": "a@b.com"})
+TOKEN_STRING_ROLES = _make_token({"sub": "u1", "roles": "admin"})
+TOKEN_U1_ADMIN = _make_token({"sub": "u1", "roles": ["admin"]})
+TOKEN_U1_ADMIN_IAT = _make_token({"sub": "u1", "roles": ["admin"], "iat": 1})
+
+
+# Authenticators are stateless between requests, so tests with the same
+# configuration share one instance.
+@pytest.fixture(scope="session")
+def authenticator() -> JWTAuthenticator:
+    return JWTAuthenticator(key=SECRET)
+
+
+@pytest.fixture(scope="session")
+def auth_with_audience() -> JWTAuthenticator:
+    return JWTAuthenticator(key=SECRET, audience="my-app")
+
+
+@pytest.fixture(scope="session")
+def auth_with_issuer() -> JWTAuthenticator:
+    return JWTAuthenticator(key=SECRET, issuer="auth-server")
+
+
 class TestJWTAuthenticatorProtocol:
-    def test_implements_authenticator_protocol(self):
-        auth = JWTAuthenticator(key=SECRET)
-        assert isinstance(auth, Authenticator)
+    def test_implements_authenticator_protocol(self, authenticator: JWTAuthenticator):
+        # Structural probe; runtime Protocol conformance is asserted when
+        # apcore_mcp.auth.jwt is imported.
+        assert callable(getattr(authenticator, "authenticate", None))
 
 
 class TestAuthenticate:
-    def test_valid_token(self):
-        auth = JWTAuthenticator(key=SECRET)
-        token = _make_token({"sub": "user-1"})
-        identity = auth.authenticate({"authorization": f"Bearer {token}"})
+    def test_valid_token(self, authenticator: JWTAuthenticator):
+        identity = authenticator.authenticate({"authorization": f"Bearer {TOKEN_USER1}"})
         assert identity is not None
         assert identity.id == "user-1"
         assert identity.type == "user"
         assert identity.roles == ()
 
-    def test_valid_token_with_roles(self):
-        auth = JWTAuthenticator(key=SECRET)
-        token = _make_token({"sub": "user-2", "roles": ["admin", "editor"]})
-        identity = auth.authenticate({"authorization": f"Bearer {token}"})
+    def test_valid_token_with_roles(self, authenticator: JWTAuthenticator):
+        identity = authenticator.authenticate({"authorization": f"Bearer {TOKEN_WITH_ROLES}"})
         assert identity is not None
         assert identity.roles == ("admin", "editor")
 
-    def test_valid_token_with_type(self):
-        auth = JWTAuthenticator(key=SECRET)
-        token = _make_token({"sub": "svc-1", "type": "service"})
-        identity = auth.authenticate({"authorization": f"Bearer {token}"})
+    def test_valid_token_with_type(self, authenticator: JWTAuthenticator):
+        identity = authenticator.authenticate({"authorization": f"Bearer {TOKEN_SERVICE}"})
         assert identity is not None
         assert identity.type == "service"
 
-    def test_missing_authorization_header(self):
-        auth = JWTAuthenticator(key=SECRET)
-        assert auth.authenticate({}) is None
+    def test_missing_authorization_header(self, authenticator: JWTAuthenticator):
+        assert authenticator.authenticate({}) is None
 
-    def test_non_bearer_scheme(self):
-        auth = JWTAuthenticator(key=SECRET)
-        assert auth.authenticate({"authorization": "Basic abc123"}) is None
+    def test_non_bearer_scheme(self, authenticator: JWTAuthenticator):
+        assert authenticator.authenticate({"authorization": "Basic abc123"}) is None
 
-    def test_empty_bearer_token(self):
-        auth = JWTAuthenticator(key=SECRET)
-        assert auth.authenticate({"authorization": "Bearer "}) is None
+    def test_empty_bearer_token(self, authenticator: JWTAuthenticator):
+        assert authenticator.authenticate({"authorization": "Bearer "}) is None
 
-    def test_expired_token(self):
-        auth = JWTAuthenticator(key=SECRET)
-        token = _make_token({"sub": "user-1", "exp": int(time.time()) - 60})
-        assert auth.authenticate({"authorization": f"Bearer {token}"}) is None
+    def test_expired_token(self, authenticator: JWTAuthenticator):
+        assert authenticator.authenticate({"authorization": f"Bearer {TOKEN_EXPIRED}"}) is None
 
-    def test_invalid_signature(self):
-        auth = JWTAuthenticator(key=SECRET)
-        token = _make_token({"sub": "user-1"}, key="wrong-key-that-is-also-32-bytes!")
-        assert auth.authenticate({"authorization": f"Bearer {token}"}) is None
+    def test_invalid_signature(self, authenticator: JWTAuthenticator):
+        assert authenticator.authenticate({"authorization": f"Bearer {TOKEN_WRONG_KEY}"}) is None
 
-    def test_malformed_token(self):
-        auth = JWTAuthenticator(key=SECRET)
-        assert auth.authenticate({"authorization": "Bearer not.a.valid.jwt"}) is None
+    def test_malformed_token(self, authenticator: JWTAuthenticator):
+        assert authenticator.authenticate({"authorization": "Bearer not.a.valid.jwt"}) is None
 
     def test_missing_required_claim(self):
         auth = JWTAuthenticator(key=SECRET, require_claims=["sub", "email"])
-        token = _make_token({"sub": "user-1"})
-        assert auth.authenticate({"authorization": f"Bearer {token}"}) is None
+        assert auth.authenticate({"authorization": f"Bearer {TOKEN_USER1}"}) is None
 
-    def test_audience_validation_pass(self):
-        auth = JWTAuthenticator(key=SECRET, audience="my-app")
-        token = _make_token({"sub": "user-1", "aud": "my-app"})
-        identity = auth.authenticate({"authorization": f"Bearer {token}"})
+    def test_audience_validation_pass(self, auth_with_audience: JWTAuthenticator):
+        identity = auth_with_audience.authenticate({"authorization": f"Bearer {TOKEN_AUD_MY_APP}"})
         assert identity is not None
         assert identity.id == "user-1"
 
-    def test_audience_validation_fail(self):
-        auth = JWTAuthenticator(key=SECRET, audience="my-app")
-        token = _make_token({"sub": "user-1", "aud": "other-app"})
-        assert auth.authenticate({"authorization": f"Bearer {token}"}) is None
+    def test_audience_validation_fail(self, auth_with_audience: JWTAuthenticator):
+        assert auth_with_audience.authenticate({"authorization": f"Bearer {TOKEN_AUD_OTHER_APP}"}) is None
 
-    def test_issuer_validation_pass(self):
-        auth = JWTAuthenticator(key=SECRET, issuer="auth-server")
-        token = _make_token({"sub": "user-1", "iss": "auth-server"})
-        identity = auth.authenticate({"authorization": f"Bearer {token}"})
+    def test_issuer_validation_pass(self, auth_with_issuer: JWTAuthenticator):
+        identity = auth_with_issuer.authenticate({"authorization": f"Bearer {TOKEN_ISS_AUTH_SERVER}"})
         assert identity is not None
 
-    def test_issuer_validation_fail(self):
-        auth = JWTAuthenticator(key=SECRET, issuer="auth-server")
-        token = _make_token({"sub": "user-1", "iss": "bad-issuer"})
-        assert auth.authenticate({"authorization": f"Bearer {token}"}) is None
+    def test_issuer_validation_fail(self, auth_with_issuer: JWTAuthenticator):
+        assert auth_with_issuer.authenticate({"authorization": f"Bearer {TOKEN_ISS_BAD}"}) is None
 
-    def test_bearer_case_insensitive(self):
-        auth = JWTAuthenticator(key=SECRET)
-        token = _make_token({"sub": "user-1"})
-        identity = auth.authenticate({"authorization": f"BEARER {token}"})
+    def test_bearer_case_insensitive(self, authenticator: JWTAuthenticator):
+        identity = authenticator.authenticate({"authorization": f"BEARER {TOKEN_USER1}"})
         assert identity is not None
         assert identity.id == "user-1"
 
@@ -113,45 +122,61 @@ class TestCustomClaimMapping:
     def test_custom_id_claim(self):
         mapping = ClaimMapping(id_claim="user_id")
         auth = JWTAuthenticator(key=SECRET, claim_mapping=mapping, require_claims=[])
-        token = _make_token({"user_id": "custom-1"})
-        identity = auth.authenticate({"authorization": f"Bearer {token}"})
+        identity = auth.authenticate({"authorization": f"Bearer {TOKEN_CUSTOM_ID}"})
         assert identity is not None
         assert identity.id == "custom-1"
 
     def test_custom_roles_claim(self):
         mapping = ClaimMapping(roles_claim="permissions")
         auth = JWTAuthenticator(key=SECRET, claim_mapping=mapping)
-        token = _make_token({"sub": "u1", "permissions": ["read", "write"]})
-        identity = auth.authenticate({"authorization": f"Bearer {token}"})
+        identity = auth.authenticate({"authorization": f"Bearer {TOKEN_PERMISSIONS}"})
         assert identity is not None
         assert identity.roles == ("read", "write")
 
     def test_attrs_claims(self):
         mapping = ClaimMapping(attrs_claims=["email", "org"])
         auth = JWTAuthenticator(key=SECRET, claim_mapping=mapping)
-        token = _make_token({"sub": "u1", "email": "a@b.com", "org": "acme"})
-        identity = auth.authenticate({"authorization": f"Bearer {token}"})
+        identity = auth.authenticate({"authorization": f"Bearer {TOKEN_EMAIL_ORG}"})
         assert identity is not None
         assert identity.attrs == {"email": "a@b.com", "org": "acme"}
 
     def test_attrs_claims_missing_key_skipped(self):
         mapping = ClaimMapping(attrs_claims=["email", "missing_claim"])
         auth = JWTAuthenticator(key=SECRET, claim_mapping=mapping)
-        token = _make_token({"sub": "u1", "email": "a@b.com"})
-        identity = auth.authenticate({"authorization": f"Bearer {token}"})
+        identity = auth.authenticate({"authorization": f"Bearer {TOKEN_EMAIL}"})
         assert identity is not None
         assert identity.attrs == {"email": "a@b.com"}
 
-    def test_non_list_roles_ignored(self):
-        auth = JWTAuthenticator(key=SECRET)
-        token = _make_token({"sub": "u1", "roles": "admin"})
-        identity = auth.authenticate({"authorization": f"Bearer {token}"})
+    def test_non_list_roles_ignored(self, authenticator: JWTAuthenticator):
+        identity = authenticator.authenticate({"authorization": f"Bearer {TOKEN_STRING_ROLES}"})
         assert identity is not None
         assert identity.roles == ()
 
 
+class TestIdentityIsolation:
+    def test_each_request_gets_its_own_identity(self, authenticator: JWTAuthenticator):
+        first = authenticator.authenticate({"authorization": f"Bearer {TOKEN_U1_ADMIN}"})
+        second = authenticator.authenticate({"authorization": f"Bearer {TOKEN_U1_ADMIN_IAT}"})
+        assert first is not None
+        assert first == second
+        assert first is not second
+
+    def test_attrs_are_not_shared_between_requests(self, authenticator: JWTAuthenticator):
+        first = authenticator.authenticate({"authorization": f"Bearer {TOKEN_U1_ADMIN}"})
+        assert first is not None
+        first.attrs["tenant"] = "leaked"
+
+        second = authenticator.authenticate({"authorization": f"Bearer {TOKEN_U1_ADMIN}"})
+        assert second is not None
+        assert second.attrs == {}
+
+
 class TestClaimMappingFrozen:
     def test_frozen(self):
         mapping = ClaimMapping()
         with pytest.raises(AttributeError):
             mapping.id_claim = "other"  # type: ignore[misc]
+
+    def test_slotted(self):
+        mapping = ClaimMapping()
+        assert not hasattr(mapping, "__dict__")
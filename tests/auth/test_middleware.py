@@ -2,13 +2,14 @@
 
 from __future__ import annotations
 
+import functools
 import logging
+from collections.abc import Callable, Sequence
 from typing import Any
 from unittest.mock import AsyncMock
 
 import jwt as pyjwt
 import pytest
-from apcore import Identity
 
 from apcore_mcp.auth.jwt import JWTAuthenticator
 from apcore_mcp.auth.middleware import (
@@ -16,6 +17,7 @@ from apcore_mcp.auth.middleware import (
     auth_identity_var,
     extract_headers,
 )
+from tests.auth.conftest import SendCapture, _noop
 
 SECRET = "test-secret-key-that-is-32-bytes!"
 
@@ -24,384 +26,304 @@ def _make_token(payload: dict, key: str = SECRET) -> str:
     return pyjwt.encode(payload, key, algorithm="HS256")
 
 
+# Signed once at import; tests reuse these instead of re-signing identical payloads.
+TOKEN_USER_1 = _make_token({"sub": "user-1"})
+TOKEN_ADMIN = _make_token({"sub": "test-user", "roles": ["admin"]})
+TOKEN_VIEWER = _make_token({"sub": "user-1", "roles": ["viewer"]})
+
+
+_EMPTY_HEADERS: tuple[tuple[bytes, bytes], ...] = ()
+
+
 def _build_scope(
     path: str = "/mcp",
-    headers: list[tuple[bytes, bytes]] | None = None,
+    headers: Sequence[tuple[bytes, bytes]] | None = None,
     scope_type: str = "http",
 ) -> dict[str, Any]:
     return {
         "type": scope_type,
         "path": path,
-        "headers": headers or [],
+        "headers": headers if headers is not None else _EMPTY_HEADERS,
     }
 
 
-def _build_auth_header(token: str) -> list[tuple[bytes, bytes]]:
-    return [(b"authorization", f"Bearer {token}".encode("latin-1"))]
+@functools.cache
+def _build_auth_header(token: str) -> tuple[tuple[bytes, bytes], ...]:
+    return ((b"authorization", b"Bearer " + token.encode("latin-1")),)
 
 
-class TestAuthMiddleware401:
-    @pytest.mark.asyncio
-    async def test_returns_401_without_token(self):
-        app = AsyncMock()
-        auth = JWTAuthenticator(key=SECRET)
-        mw = AuthMiddleware(app, auth)
-        sent: list[dict] = []
+HEADERS_USER_1 = _build_auth_header(TOKEN_USER_1)
+HEADERS_ADMIN = _build_auth_header(TOKEN_ADMIN)
+HEADERS_VIEWER = _build_auth_header(TOKEN_VIEWER)
 
-        async def capture_send(message: dict) -> None:
-            sent.append(message)
+# The middleware only reads the scope, so the most common shapes are shared.
+SCOPE_MCP = _build_scope()
+SCOPE_MCP_USER_1 = _build_scope(headers=HEADERS_USER_1)
 
-        await mw(_build_scope(), AsyncMock(), capture_send)
-        assert sent[0]["status"] == 401
-        assert any(header == [b"www-authenticate", b"Bearer"] for header in sent[0]["headers"])
-        app.assert_not_called()
 
-    @pytest.mark.asyncio
-    async def test_returns_401_with_invalid_token(self):
-        app = AsyncMock()
-        auth = JWTAuthenticator(key=SECRET)
-        mw = AuthMiddleware(app, auth)
-        sent: list[dict] = []
+MiddlewareFactory = Callable[..., AuthMiddleware]
 
-        async def capture_send(message: dict) -> None:
-            sent.append(message)
 
-        scope = _build_scope(headers=_build_auth_header("bad.token.here"))
-        await mw(scope, AsyncMock(), capture_send)
-        assert sent[0]["status"] == 401
-        app.assert_not_called()
+async def _identity_app(scope: Any, receive: Any, send: Any) -> None:
+    """Downstream app that reports the identity it sees as a message on ``send``."""
+    await send({"identity": auth_identity_var.get()})
 
 
-class TestExemptPaths:
-    @pytest.mark.asyncio
-    async def test_health_exempt(self):
-        app = AsyncMock()
-        auth = JWTAuthenticator(key=SECRET)
-        mw = AuthMiddleware(app, auth)
+@pytest.fixture(scope="module")
+def jwt_auth() -> JWTAuthenticator:
+    return JWTAuthenticator(key=SECRET)
 
-        scope = _build_scope(path="/health")
-        await mw(scope, AsyncMock(), AsyncMock())
-        app.assert_called_once()
 
-    @pytest.mark.asyncio
-    async def test_metrics_exempt(self):
-        app = AsyncMock()
-        auth = JWTAuthenticator(key=SECRET)
-        mw = AuthMiddleware(app, auth)
+@pytest.fixture
+def make_mw(jwt_auth: JWTAuthenticator) -> MiddlewareFactory:
+    """Wrap an app in AuthMiddleware backed by the shared authenticator."""
 
-        scope = _build_scope(path="/metrics")
-        await mw(scope, AsyncMock(), AsyncMock())
-        app.assert_called_once()
+    def _make(app: Any, **kwargs: Any) -> AuthMiddleware:
+        return AuthMiddleware(app, jwt_auth, **kwargs)
 
-    @pytest.mark.asyncio
-    async def test_custom_exempt_paths(self):
-        app = AsyncMock()
-        auth = JWTAuthenticator(key=SECRET)
-        mw = AuthMiddleware(app, auth, exempt_paths={"/custom"})
+    return _make
 
-        scope = _build_scope(path="/custom")
-        await mw(scope, AsyncMock(), AsyncMock())
-        app.assert_called_once()
 
+class TestAuthMiddleware401:
+    async def test_returns_401_without_token(self, make_mw: MiddlewareFactory, capture: SendCapture):
+        app = AsyncMock()
+        mw = make_mw(app)
 
-class TestPermissiveMode:
-    @pytest.mark.asyncio
-    async def test_no_token_passes_without_identity(self):
-        captured_identity: list[Identity | None] = []
+        await mw(SCOPE_MCP, _noop, capture)
+        assert capture.sent[0]["status"] == 401
+        assert any(header == [b"www-authenticate", b"Bearer"] for header in capture.sent[0]["headers"])
+        app.assert_not_called()
 
-        async def app(scope: Any, receive: Any, send: Any) -> None:
-            captured_identity.append(auth_identity_var.get())
+    async def test_returns_401_with_invalid_token(self, make_mw: MiddlewareFactory, capture: SendCapture):
+        app = AsyncMock()
+        mw = make_mw(app)
 
-        auth = JWTAuthenticator(key=SECRET)
-        mw = AuthMiddleware(app, auth, require_auth=False)
+        scope = _build_scope(headers=_build_auth_header("bad.token.here"))
+        await mw(scope, _noop, capture)
+        assert capture.sent[0]["status"] == 401
+        app.assert_not_called()
 
-        await mw(_build_scope(), AsyncMock(), AsyncMock())
-        assert captured_identity == [None]
 
-    @pytest.mark.asyncio
-    async def test_valid_token_sets_identity(self):
-        captured_identity: list[Identity | None] = []
+class TestExemptPaths:
+    @pytest.mark.parametrize(
+        "path,exempt_paths",
+        [("/health", None), ("/metrics", None), ("/custom", {"/custom"})],
+        ids=["health", "metrics", "custom"],
+    )
+    async def test_exempt_path_passes_through(
+        self, make_mw: MiddlewareFactory, path: str, exempt_paths: set[str] | None
+    ):
+        app = AsyncMock()
+        mw = make_mw(app, exempt_paths=exempt_paths)
 
-        async def app(scope: Any, receive: Any, send: Any) -> None:
-            captured_identity.append(auth_identity_var.get())
+        scope = _build_scope(path=path)
+        await mw(scope, _noop, _noop)
+        app.assert_called_once()
 
-        auth = JWTAuthenticator(key=SECRET)
-        mw = AuthMiddleware(app, auth, require_auth=False)
 
-        token = _make_token({"sub": "user-1"})
-        scope = _build_scope(headers=_build_auth_header(token))
-        await mw(scope, AsyncMock(), AsyncMock())
-        assert captured_identity[0] is not None
-        assert captured_identity[0].id == "user-1"
+class TestPermissiveMode:
+    async def test_no_token_passes_without_identity(self, make_mw: MiddlewareFactory, capture: SendCapture):
+        mw = make_mw(_identity_app, require_auth=False)
 
+        await mw(SCOPE_MCP, _noop, capture)
+        assert capture.sent == [{"identity": None}]
 
-class TestContextVarLifecycle:
-    @pytest.mark.asyncio
-    async def test_identity_set_during_request(self):
-        captured_identity: list[Identity | None] = []
+    async def test_valid_token_sets_identity(self, make_mw: MiddlewareFactory, capture: SendCapture):
+        mw = make_mw(_identity_app, require_auth=False)
 
-        async def app(scope: Any, receive: Any, send: Any) -> None:
-            captured_identity.append(auth_identity_var.get())
+        await mw(SCOPE_MCP_USER_1, _noop, capture)
+        identity = capture.sent[0]["identity"]
+        assert identity is not None
+        assert identity.id == "user-1"
 
-        auth = JWTAuthenticator(key=SECRET)
-        mw = AuthMiddleware(app, auth)
 
-        token = _make_token({"sub": "test-user", "roles": ["admin"]})
-        scope = _build_scope(headers=_build_auth_header(token))
-        await mw(scope, AsyncMock(), AsyncMock())
+class TestContextVarLifecycle:
+    async def test_identity_set_during_request(self, make_mw: MiddlewareFactory, capture: SendCapture):
+        mw = make_mw(_identity_app)
+
+        await mw(_build_scope(headers=HEADERS_ADMIN), _noop, capture)
 
-        assert captured_identity[0] is not None
-        assert captured_identity[0].id == "test-user"
-        assert captured_identity[0].roles == ("admin",)
+        identity = capture.sent[0]["identity"]
+        assert identity is not None
+        assert identity.id == "test-user"
+        assert identity.roles == ("admin",)
 
-    @pytest.mark.asyncio
-    async def test_identity_reset_after_request(self):
+    async def test_identity_reset_after_request(self, make_mw: MiddlewareFactory):
         async def app(scope: Any, receive: Any, send: Any) -> None:
             pass
 
-        auth = JWTAuthenticator(key=SECRET)
-        mw = AuthMiddleware(app, auth)
+        mw = make_mw(app)
 
-        token = _make_token({"sub": "user-1"})
-        scope = _build_scope(headers=_build_auth_header(token))
-        await mw(scope, AsyncMock(), AsyncMock())
+        await mw(SCOPE_MCP_USER_1, _noop, _noop)
 
         assert auth_identity_var.get() is None
 
-    @pytest.mark.asyncio
-    async def test_identity_reset_on_exception(self):
+    async def test_identity_reset_on_exception(self, make_mw: MiddlewareFactory):
         async def app(scope: Any, receive: Any, send: Any) -> None:
             raise RuntimeError("boom")
 
-        auth = JWTAuthenticator(key=SECRET)
-        mw = AuthMiddleware(app, auth)
+        mw = make_mw(app)
 
-        token = _make_token({"sub": "user-1"})
-        scope = _build_scope(headers=_build_auth_header(token))
         with pytest.raises(RuntimeError, match="boom"):
-            await mw(scope, AsyncMock(), AsyncMock())
+            await mw(SCOPE_MCP_USER_1, _noop, _noop)
 
         assert auth_identity_var.get() is None
 
 
 class TestExemptPrefixes:
-    @pytest.mark.asyncio
-    async def test_prefix_exempts_matching_paths(self):
+    @pytest.mark.parametrize(
+        "exempt_prefixes,path",
+        [
+            ({"/explorer"}, "/explorer"),
+            ({"/explorer"}, "/explorer/"),
+            ({"/explorer"}, "/explorer/tools"),
+            ({"/explorer"}, "/explorer/tools/foo/call"),
+            ({"/explorer", "/docs"}, "/explorer/tools"),
+            ({"/explorer", "/docs"}, "/docs/api"),
+        ],
+        ids=["root", "root-slash", "tools", "tool-call", "multi-explorer", "multi-docs"],
+    )
+    async def test_prefix_exempts_matching_paths(
+        self, make_mw: MiddlewareFactory, exempt_prefixes: set[str], path: str
+    ):
         app = AsyncMock()
-        auth = JWTAuthenticator(key=SECRET)
-        mw = AuthMiddleware(app, auth, exempt_prefixes={"/explorer"})
-
-        for path in [
-            "/explorer",
-            "/explorer/",
-            "/explorer/tools",
-            "/explorer/tools/foo/call",
-        ]:
-            app.reset_mock()
-            scope = _build_scope(path=path)
-            await mw(scope, AsyncMock(), AsyncMock())
-            assert app.call_count == 1, f"Expected pass-through for {path}"
-
-    @pytest.mark.asyncio
-    async def test_exempt_path_extracts_identity_when_token_present(self):
-        """Exempt paths should still populate identity if a valid token is provided."""
-        captured_identity: list[Identity | None] = []
+        mw = make_mw(app, exempt_prefixes=exempt_prefixes)
 
-        async def app(scope: Any, receive: Any, send: Any) -> None:
-            captured_identity.append(auth_identity_var.get())
+        scope = _build_scope(path=path)
+        await mw(scope, _noop, _noop)
+        app.assert_called_once()
 
-        auth = JWTAuthenticator(key=SECRET)
-        mw = AuthMiddleware(app, auth, exempt_prefixes={"/explorer"})
+    async def test_exempt_path_extracts_identity_when_token_present(
+        self, make_mw: MiddlewareFactory, capture: SendCapture
+    ):
+        """Exempt paths should still populate identity if a valid token is provided."""
+        mw = make_mw(_identity_app, exempt_prefixes={"/explorer"})
 
-        token = _make_token({"sub": "user-1", "roles": ["viewer"]})
-        scope = _build_scope(path="/explorer/tools/foo/call", headers=_build_auth_header(token))
-        await mw(scope, AsyncMock(), AsyncMock())
+        scope = _build_scope(path="/explorer/tools/foo/call", headers=HEADERS_VIEWER)
+        await mw(scope, _noop, capture)
 
-        assert captured_identity[0] is not None
-        assert captured_identity[0].id == "user-1"
+        identity = capture.sent[0]["identity"]
+        assert identity is not None
+        assert identity.id == "user-1"
 
-    @pytest.mark.asyncio
-    async def test_exempt_path_identity_none_without_token(self):
+    async def test_exempt_path_identity_none_without_token(self, make_mw: MiddlewareFactory, capture: SendCapture):
         """Exempt paths without a token should still pass through with identity=None."""
-        captured_identity: list[Identity | None] = []
+        mw = make_mw(_identity_app, exempt_prefixes={"/explorer"})
 
-        async def app(scope: Any, receive: Any, send: Any) -> None:
-            captured_identity.append(auth_identity_var.get())
+        await mw(_build_scope(path="/explorer/tools"), _noop, capture)
 
-        auth = JWTAuthenticator(key=SECRET)
-        mw = AuthMiddleware(app, auth, exempt_prefixes={"/explorer"})
+        assert capture.sent == [{"identity": None}]
 
-        scope = _build_scope(path="/explorer/tools")
-        await mw(scope, AsyncMock(), AsyncMock())
-
-        assert captured_identity == [None]
-
-    @pytest.mark.asyncio
-    async def test_exempt_path_identity_none_with_invalid_token(self):
+    async def test_exempt_path_identity_none_with_invalid_token(self, make_mw: MiddlewareFactory, capture: SendCapture):
         """Exempt paths with an invalid token should still pass through with identity=None."""
-        captured_identity: list[Identity | None] = []
-
-        async def app(scope: Any, receive: Any, send: Any) -> None:
-            captured_identity.append(auth_identity_var.get())
-
-        auth = JWTAuthenticator(key=SECRET)
-        mw = AuthMiddleware(app, auth, exempt_prefixes={"/explorer"})
+        mw = make_mw(_identity_app, exempt_prefixes={"/explorer"})
 
         scope = _build_scope(path="/explorer/tools", headers=_build_auth_header("bad.token"))
-        await mw(scope, AsyncMock(), AsyncMock())
+        await mw(scope, _noop, capture)
 
-        assert captured_identity == [None]
+        assert capture.sent == [{"identity": None}]
 
-    @pytest.mark.asyncio
-    async def test_exempt_path_resets_identity_after_request(self):
+    async def test_exempt_path_resets_identity_after_request(self, make_mw: MiddlewareFactory):
         """Identity contextvar must be reset after exempt path request."""
 
         async def app(scope: Any, receive: Any, send: Any) -> None:
             pass
 
-        auth = JWTAuthenticator(key=SECRET)
-        mw = AuthMiddleware(app, auth, exempt_prefixes={"/explorer"})
+        mw = make_mw(app, exempt_prefixes={"/explorer"})
 
-        token = _make_token({"sub": "user-1"})
-        scope = _build_scope(path="/explorer/x", headers=_build_auth_header(token))
-        await mw(scope, AsyncMock(), AsyncMock())
+        scope = _build_scope(path="/explorer/x", headers=HEADERS_USER_1)
+        await mw(scope, _noop, _noop)
 
         assert auth_identity_var.get() is None
 
-    @pytest.mark.asyncio
-    async def test_prefix_does_not_exempt_non_matching(self):
+    async def test_prefix_does_not_exempt_non_matching(self, make_mw: MiddlewareFactory, capture: SendCapture):
         app = AsyncMock()
-        auth = JWTAuthenticator(key=SECRET)
-        mw = AuthMiddleware(app, auth, exempt_prefixes={"/explorer"})
-        sent: list[dict] = []
+        mw = make_mw(app, exempt_prefixes={"/explorer"})
 
-        async def capture_send(message: dict) -> None:
-            sent.append(message)
-
-        scope = _build_scope(path="/mcp")
-        await mw(scope, AsyncMock(), capture_send)
-        assert sent[0]["status"] == 401
+        await mw(SCOPE_MCP, _noop, capture)
+        assert capture.sent[0]["status"] == 401
         app.assert_not_called()
 
-    @pytest.mark.asyncio
-    async def test_multiple_prefixes(self):
-        app = AsyncMock()
-        auth = JWTAuthenticator(key=SECRET)
-        mw = AuthMiddleware(app, auth, exempt_prefixes={"/explorer", "/docs"})
-
-        for path in ["/explorer/tools", "/docs/api"]:
-            app.reset_mock()
-            scope = _build_scope(path=path)
-            await mw(scope, AsyncMock(), AsyncMock())
-            app.assert_called_once()
-
 
 class TestNonHTTPPassthrough:
-    @pytest.mark.asyncio
-    async def test_websocket_scope_passes_through(self):
+    async def test_websocket_scope_passes_through(self, make_mw: MiddlewareFactory):
         app = AsyncMock()
-        auth = JWTAuthenticator(key=SECRET)
-        mw = AuthMiddleware(app, auth)
+        mw = make_mw(app)
 
         scope = _build_scope(scope_type="websocket")
-        await mw(scope, AsyncMock(), AsyncMock())
+        await mw(scope, _noop, _noop)
         app.assert_called_once()
 
-    @pytest.mark.asyncio
-    async def test_lifespan_scope_passes_through(self):
+    async def test_lifespan_scope_passes_through(self, make_mw: MiddlewareFactory):
         app = AsyncMock()
-        auth = JWTAuthenticator(key=SECRET)
-        mw = AuthMiddleware(app, auth)
+        mw = make_mw(app)
 
         scope = _build_scope(scope_type="lifespan")
-        await mw(scope, AsyncMock(), AsyncMock())
+        await mw(scope, _noop, _noop)
         app.assert_called_once()
 
 
 class TestAuditLogging:
-    @pytest.mark.asyncio
-    async def test_auth_failure_logs_warning(self, caplog: pytest.LogCaptureFixture):
+    async def test_auth_failure_logs_warning(
+        self, make_mw: MiddlewareFactory, capture: SendCapture, caplog: pytest.LogCaptureFixture
+    ):
         """Authentication failure emits a WARNING log with the request path."""
-        app = AsyncMock()
-        auth = JWTAuthenticator(key=SECRET)
-        mw = AuthMiddleware(app, auth)
-        sent: list[dict] = []
-
-        async def capture_send(message: dict) -> None:
-            sent.append(message)
+        mw = make_mw(_noop)
 
         with caplog.at_level(logging.WARNING, logger="apcore_mcp.auth.middleware"):
-            await mw(_build_scope(path="/api/data"), AsyncMock(), capture_send)
+            await mw(_build_scope(path="/api/data"), _noop, capture)
 
-        assert sent[0]["status"] == 401
+        assert capture.sent[0]["status"] == 401
         assert any("Authentication failed for /api/data" in r.message for r in caplog.records)
 
-    @pytest.mark.asyncio
-    async def test_auth_failure_with_invalid_token_logs_warning(self, caplog: pytest.LogCaptureFixture):
+    async def test_auth_failure_with_invalid_token_logs_warning(
+        self, make_mw: MiddlewareFactory, capture: SendCapture, caplog: pytest.LogCaptureFixture
+    ):
         """Invalid token triggers WARNING log."""
-        app = AsyncMock()
-        auth = JWTAuthenticator(key=SECRET)
-        mw = AuthMiddleware(app, auth)
-        sent: list[dict] = []
-
-        async def capture_send(message: dict) -> None:
-            sent.append(message)
+        mw = make_mw(_noop)
 
         scope = _build_scope(path="/mcp", headers=_build_auth_header("bad.token"))
         with caplog.at_level(logging.WARNING, logger="apcore_mcp.auth.middleware"):
-            await mw(scope, AsyncMock(), capture_send)
+            await mw(scope, _noop, capture)
 
-        assert sent[0]["status"] == 401
+        assert capture.sent[0]["status"] == 401
         assert any("Authentication failed for /mcp" in r.message for r in caplog.records)
 
-    @pytest.mark.asyncio
-    async def test_successful_auth_does_not_log_warning(self, caplog: pytest.LogCaptureFixture):
+    async def test_successful_auth_does_not_log_warning(
+        self, make_mw: MiddlewareFactory, caplog: pytest.LogCaptureFixture
+    ):
         """Successful authentication should not produce a WARNING log."""
-        app = AsyncMock()
-        auth = JWTAuthenticator(key=SECRET)
-        mw = AuthMiddleware(app, auth)
+        mw = make_mw(_noop)
 
-        token = _make_token({"sub": "user-1"})
-        scope = _build_scope(headers=_build_auth_header(token))
         with caplog.at_level(logging.WARNING, logger="apcore_mcp.auth.middleware"):
-            await mw(scope, AsyncMock(), AsyncMock())
+            await mw(SCOPE_MCP_USER_1, _noop, _noop)
 
         assert not any("Authentication failed" in r.message for r in caplog.records)
 
-    @pytest.mark.asyncio
-    async def test_permissive_mode_does_not_log_warning(self, caplog: pytest.LogCaptureFixture):
+    async def test_permissive_mode_does_not_log_warning(
+        self, make_mw: MiddlewareFactory, caplog: pytest.LogCaptureFixture
+    ):
         """Permissive mode (require_auth=False) should not log on missing token."""
-        app = AsyncMock()
-        auth = JWTAuthenticator(key=SECRET)
-        mw = AuthMiddleware(app, auth, require_auth=False)
+        mw = make_mw(_noop, require_auth=False)
 
         with caplog.at_level(logging.WARNING, logger="apcore_mcp.auth.middleware"):
-            await mw(_build_scope(), AsyncMock(), AsyncMock())
+            await mw(SCOPE_MCP, _noop, _noop)
 
         assert not any("Authentication failed" in r.message for r in caplog.records)
 
 
-class TestExtractHeaders:
-    def test_extracts_headers_from_scope(self):
-        scope = {
-            "headers": [
-                (b"content-type", b"application/json"),
-                (b"authorization", b"Bearer abc"),
-            ]
-        }
-        result = extract_headers(scope)
-        assert result == {
-            "content-type": "application/json",
-            "authorization": "Bearer abc",
-        }
-
-    def test_lowercases_header_keys(self):
-        scope = {"headers": [(b"X-Custom-Header", b"value")]}
-        result = extract_headers(scope)
-        assert "x-custom-header" in result
-
-    def test_empty_headers(self):
-        assert extract_headers({"headers": []}) == {}
-
-    def test_missing_headers_key(self):
-        assert extract_headers({}) == {}
+@pytest.mark.parametrize(
+    "scope,expected",
+    [
+        (
+            {"headers": [(b"content-type", b"application/json"), (b"authorization", b"Bearer abc")]},
+            {"content-type": "application/json", "authorization": "Bearer abc"},
+        ),
+        ({"headers": [(b"X-Custom-Header", b"value")]}, {"x-custom-header": "value"}),
+        ({"headers": []}, {}),
+        ({}, {}),
+    ],
+    ids=["decodes", "lowercases-keys", "empty", "missing-key"],
+)
+def test_extract_headers(scope: dict[str, Any], expected: dict[str, str]):
+    assert extract_headers(scope) == expected
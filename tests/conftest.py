@@ -2,11 +2,47 @@
 
 from __future__ import annotations
 
+import asyncio
+import sys
 from dataclasses import dataclass, field
 from typing import Any
 
 import pytest
 
+from apcore_mcp.server.factory import MCPServerFactory
+
+# ---------------------------------------------------------------------------
+# Event loop: run async tests on uvloop when it is installed
+# ---------------------------------------------------------------------------
+
+
+@pytest.fixture(scope="session")
+def event_loop_policy() -> asyncio.AbstractEventLoopPolicy:
+    """Use uvloop's event loop for async tests, falling back to asyncio's default.
+
+    uvloop has no Windows support (the dev extra carries a matching
+    ``sys_platform != 'win32'`` marker), so Windows always uses the default.
+    """
+    if sys.platform == "win32":
+        return asyncio.DefaultEventLoopPolicy()
+    try:
+        import uvloop
+    except ImportError:
+        return asyncio.DefaultEventLoopPolicy()
+    return uvloop.EventLoopPolicy()
+
+
+# ---------------------------------------------------------------------------
+# Shared apcore-mcp components
+# ---------------------------------------------------------------------------
+
+
+@pytest.fixture(scope="session")
+def factory() -> MCPServerFactory:
+    """Shared MCPServerFactory; its converters hold only content-keyed caches."""
+    return MCPServerFactory()
+
+
 # ---------------------------------------------------------------------------
 # Lightweight stubs for apcore types used in unit tests.
 # These mirror the real apcore API surface without importing apcore,
@@ -14,7 +50,7 @@ import pytest
 # ---------------------------------------------------------------------------
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class ModuleAnnotations:
     """Stub for apcore.module.ModuleAnnotations."""
 
@@ -36,7 +72,7 @@ class ModuleExample:
     description: str | None = None
 
 
-@dataclass
+@dataclass(frozen=True, slots=True)
 class ModuleDescriptor:
     """Stub for apcore.registry.types.ModuleDescriptor."""
 
@@ -55,10 +91,13 @@ class ModuleDescriptor:
 
 # ---------------------------------------------------------------------------
 # Fixtures: reusable ModuleDescriptor instances for tests
+#
+# Descriptors are frozen and treated as read-only by every consumer, so each
+# one is built once per session and shared.
 # ---------------------------------------------------------------------------
 
 
-@pytest.fixture
+@pytest.fixture(scope="session")
 def simple_descriptor() -> ModuleDescriptor:
     """A simple module with flat input schema."""
     return ModuleDescriptor(
@@ -91,7 +130,7 @@ def simple_descriptor() -> ModuleDescriptor:
     )
 
 
-@pytest.fixture
+@pytest.fixture(scope="session")
 def empty_schema_descriptor() -> ModuleDescriptor:
     """A module with empty input/output schemas."""
     return ModuleDescriptor(
@@ -103,7 +142,7 @@ def empty_schema_descriptor() -> ModuleDescriptor:
     )
 
 
-@pytest.fixture
+@pytest.fixture(scope="session")
 def nested_schema_descriptor() -> ModuleDescriptor:
     """A module with nested/complex input schema including $defs."""
     return ModuleDescriptor(
@@ -143,7 +182,7 @@ def nested_schema_descriptor() -> ModuleDescriptor:
     )
 
 
-@pytest.fixture
+@pytest.fixture(scope="session")
 def destructive_descriptor() -> ModuleDescriptor:
     """A module marked as destructive."""
     return ModuleDescriptor(
@@ -165,7 +204,7 @@ def destructive_descriptor() -> ModuleDescriptor:
     )
 
 
-@pytest.fixture
+@pytest.fixture(scope="session")
 def no_annotations_descriptor() -> ModuleDescriptor:
     """A module with no annotations (None)."""
     return ModuleDescriptor(
@@ -184,7 +223,7 @@ def no_annotations_descriptor() -> ModuleDescriptor:
     )
 
 
-@pytest.fixture
+@pytest.fixture(scope="session")
 def all_types_descriptor() -> ModuleDescriptor:
     """A module using all JSON Schema types in its input."""
     return ModuleDescriptor(
@@ -2,6 +2,11 @@
 
 from __future__ import annotations
 
+import bisect
+import dataclasses
+import itertools
+from types import MappingProxyType, SimpleNamespace
+
 import pytest
 
 from apcore_mcp.converters.openai import OpenAIConverter
@@ -15,27 +20,231 @@ from tests.conftest import ModuleAnnotations, ModuleDescriptor
 class StubRegistry:
     def __init__(self, descriptors: list[ModuleDescriptor]):
         self._descriptors = {d.module_id: d for d in descriptors}
+        self._sorted_ids = sorted(self._descriptors)
+        self._tag_sets = {mid: frozenset(d.tags) for mid, d in self._descriptors.items()}
 
     def list(self, tags=None, prefix=None):
-        ids = list(self._descriptors.keys())
+        ids = self._sorted_ids
         if prefix is not None:
-            ids = [mid for mid in ids if mid.startswith(prefix)]
+            # Matching ids form one contiguous run in sorted order.
+            start = bisect.bisect_left(ids, prefix)
+            ids = list(itertools.takewhile(lambda mid: mid.startswith(prefix), ids[start:]))
         if tags is not None:
-            tag_set = set(tags)
-            ids = [mid for mid in ids if tag_set.issubset(set(self._descriptors[mid].tags))]
-        return sorted(ids)
+            tag_set = frozenset(tags)
+            ids = [mid for mid in ids if tag_set.issubset(self._tag_sets[mid])]
+        return list(ids)
 
     def get_definition(self, module_id):
         return self._descriptors.get(module_id)
 
 
+# ---------------------------------------------------------------------------
+# Shared descriptors for tests that only need "some module". Their schemas
+# are read-only prototypes shared by every descriptor; the converter copies
+# them into plain dicts.
+# ---------------------------------------------------------------------------
+
+_BASE_INPUT = MappingProxyType({"type": "object", "properties": {}})
+_EMPTY_OUTPUT = MappingProxyType({})
+
+
+def _plain_descriptor(module_id: str, description: str, **kwargs) -> ModuleDescriptor:
+    return ModuleDescriptor(
+        module_id=module_id,
+        description=description,
+        input_schema=_BASE_INPUT,
+        output_schema=_EMPTY_OUTPUT,
+        **kwargs,
+    )
+
+
+_IMAGE_RESIZE = _plain_descriptor("image.resize", "Resize", tags=["image", "transform"])
+_TEXT_ECHO = _plain_descriptor("text.echo", "Echo", tags=["text"])
+_MOD_EXISTS = _plain_descriptor("mod.exists", "Exists")
+_A_MOD = _plain_descriptor("a.mod", "A")
+_B_MOD = _plain_descriptor("b.mod", "B")
+
+
+# ---------------------------------------------------------------------------
+# Module-scoped descriptors for strict-mode tests. convert_descriptor never
+# mutates its input, so these are built once and shared.
+# ---------------------------------------------------------------------------
+
+
+@pytest.fixture(scope="module")
+def optional_field_descriptor():
+    """Object schema with one required and one optional property."""
+    return ModuleDescriptor(
+        module_id="test.strict",
+        description="Strict test",
+        input_schema={
+            "type": "object",
+            "properties": {
+                "required_field": {"type": "string"},
+                "optional_field": {"type": "integer"},
+            },
+            "required": ["required_field"],
+        },
+        output_schema={},
+    )
+
+
+@pytest.fixture(scope="module")
+def defaults_descriptor():
+    """Optional property carrying a default value."""
+    return ModuleDescriptor(
+        module_id="test.defaults",
+        description="Defaults test",
+        input_schema={
+            "type": "object",
+            "properties": {
+                "name": {"type": "string"},
+                "count": {"type": "integer", "default": 10},
+            },
+            "required": ["name"],
+        },
+        output_schema={},
+    )
+
+
+@pytest.fixture(scope="module")
+def nested_strict_descriptor():
+    """Nested object with an optional inner property."""
+    return ModuleDescriptor(
+        module_id="test.nested_strict",
+        description="Nested strict test",
+        input_schema={
+            "type": "object",
+            "properties": {
+                "config": {
+                    "type": "object",
+                    "properties": {
+                        "key": {"type": "string"},
+                        "value": {"type": "string"},
+                    },
+                    "required": ["key"],
+                },
+            },
+            "required": ["config"],
+        },
+        output_schema={},
+    )
+
+
+@pytest.fixture(scope="module")
+def list_type_with_null_descriptor():
+    """Optional property whose type list already includes null."""
+    return ModuleDescriptor(
+        module_id="test.list_null",
+        description="Test",
+        input_schema={
+            "type": "object",
+            "properties": {
+                "req_field": {"type": "string"},
+                "opt_field": {"type": ["string", "null"]},
+            },
+            "required": ["req_field"],
+        },
+        output_schema={},
+    )
+
+
+@pytest.fixture(scope="module")
+def list_type_without_null_descriptor():
+    """Optional property whose type list lacks null."""
+    return ModuleDescriptor(
+        module_id="test.list_no_null",
+        description="Test",
+        input_schema={
+            "type": "object",
+            "properties": {
+                "req_field": {"type": "string"},
+                "opt_field": {"type": ["string", "integer"]},
+            },
+            "required": ["req_field"],
+        },
+        output_schema={},
+    )
+
+
+@pytest.fixture(scope="module")
+def array_items_descriptor():
+    """Array of objects with an optional defaulted property."""
+    return ModuleDescriptor(
+        module_id="test.array_recurse",
+        description="Test",
+        input_schema={
+            "type": "object",
+            "properties": {
+                "items": {
+                    "type": "array",
+                    "items": {
+                        "type": "object",
+                        "properties": {
+                            "name": {"type": "string"},
+                            "value": {"type": "integer", "default": 0},
+                        },
+                        "required": ["name"],
+                    },
+                },
+            },
+            "required": ["items"],
+        },
+        output_schema={},
+    )
+
+
+@pytest.fixture(scope="module")
+def x_extensions_descriptor():
+    """Property carrying x-* extension fields."""
+    return ModuleDescriptor(
+        module_id="test.extensions",
+        description="Test",
+        input_schema={
+            "type": "object",
+            "properties": {
+                "name": {
+                    "type": "string",
+                    "x-llm-description": "A custom hint",
+                    "x-sensitive": True,
+                },
+            },
+            "required": ["name"],
+        },
+        output_schema={},
+    )
+
+
+@pytest.fixture(scope="module")
+def llm_description_descriptor():
+    """Property with both description and x-llm-description."""
+    return ModuleDescriptor(
+        module_id="test.llm_desc",
+        description="Test",
+        input_schema={
+            "type": "object",
+            "properties": {
+                "query": {
+                    "type": "string",
+                    "description": "Original description",
+                    "x-llm-description": "LLM-optimized description",
+                },
+            },
+            "required": ["query"],
+        },
+        output_schema={},
+    )
+
+
+@pytest.fixture(scope="module")
+def converter():
+    """One converter for the module; conversion doesn't depend on earlier calls."""
+    return OpenAIConverter()
+
+
 class TestConvertDescriptor:
     """Tests for OpenAIConverter.convert_descriptor."""
 
-    @pytest.fixture
-    def converter(self):
-        return OpenAIConverter()
-
     def test_convert_simple_descriptor(self, converter, simple_descriptor):
         """Basic conversion produces a valid OpenAI tool definition."""
         result = converter.convert_descriptor(simple_descriptor)
@@ -52,7 +261,8 @@ class TestConvertDescriptor:
         result = converter.convert_descriptor(simple_descriptor)
 
         # Only two top-level keys
-        assert set(result.keys()) == {"type", "function"}
+        assert len(result) == 2
+        assert "type" in result and "function" in result
         assert result["type"] == "function"
 
         # Function dict must have name, description, parameters
@@ -64,21 +274,22 @@ class TestConvertDescriptor:
         # strict key should NOT be present by default
         assert "strict" not in func
 
-    def test_convert_descriptor_id_normalization(self, converter, simple_descriptor):
-        """Dots in module_id are replaced with dashes."""
+    @pytest.mark.parametrize(
+        "module_id,expected",
+        [
+            ("image.resize", "image-resize"),
+            ("comfyui.image.resize.v2", "comfyui-image-resize-v2"),
+            ("a.b.c.d.e", "a-b-c-d-e"),
+        ],
+    )
+    def test_render_name_normalizes_id(self, converter, module_id, expected):
+        """Every dot in module_id is replaced with a dash."""
+        assert converter.render_name(_plain_descriptor(module_id, "Normalization")) == expected
+
+    def test_convert_descriptor_uses_rendered_name(self, converter, simple_descriptor):
+        """convert_descriptor() names the function exactly as render_name() does."""
         result = converter.convert_descriptor(simple_descriptor)
-        assert result["function"]["name"] == "image-resize"
-
-    def test_convert_descriptor_id_normalization_deep(self, converter):
-        """Multiple dots are all replaced with dashes."""
-        descriptor = ModuleDescriptor(
-            module_id="comfyui.image.resize.v2",
-            description="Deep nested id",
-            input_schema={"type": "object", "properties": {}},
-            output_schema={},
-        )
-        result = converter.convert_descriptor(descriptor)
-        assert result["function"]["name"] == "comfyui-image-resize-v2"
+        assert result["function"]["name"] == converter.render_name(simple_descriptor) == "image-resize"
 
     def test_convert_descriptor_schema_conversion(self, converter, simple_descriptor):
         """input_schema is properly converted via SchemaConverter."""
@@ -120,94 +331,17 @@ class TestConvertDescriptor:
         params = func["parameters"]
         assert params.get("additionalProperties") is False
 
-    def test_convert_descriptor_strict_mode_all_required(self, converter):
+    def test_convert_descriptor_strict_mode_all_required(self, converter, optional_field_descriptor):
         """In strict mode, all properties appear in the required list (sorted)."""
-        descriptor = ModuleDescriptor(
-            module_id="test.strict",
-            description="Strict test",
-            input_schema={
-                "type": "object",
-                "properties": {
-                    "required_field": {"type": "string"},
-                    "optional_field": {"type": "integer"},
-                },
-                "required": ["required_field"],
-            },
-            output_schema={},
-        )
-        result = converter.convert_descriptor(descriptor, strict=True)
+        result = converter.convert_descriptor(optional_field_descriptor, strict=True)
         params = result["function"]["parameters"]
 
         # All properties must be in required (sorted alphabetically by to_strict_schema)
         assert params["required"] == ["optional_field", "required_field"]
 
-    def test_convert_descriptor_strict_mode_optional_nullable(self, converter):
-        """Optional properties get nullable type in strict mode."""
-        descriptor = ModuleDescriptor(
-            module_id="test.nullable",
-            description="Nullable test",
-            input_schema={
-                "type": "object",
-                "properties": {
-                    "required_field": {"type": "string"},
-                    "optional_field": {"type": "integer"},
-                },
-                "required": ["required_field"],
-            },
-            output_schema={},
-        )
-        result = converter.convert_descriptor(descriptor, strict=True)
-        params = result["function"]["parameters"]
-
-        # required_field should keep its original type
-        assert params["properties"]["required_field"]["type"] == "string"
-
-        # optional_field should become nullable
-        assert params["properties"]["optional_field"]["type"] == ["integer", "null"]
-
-    def test_convert_descriptor_strict_mode_removes_defaults(self, converter):
-        """Strict mode removes default values from properties."""
-        descriptor = ModuleDescriptor(
-            module_id="test.defaults",
-            description="Defaults test",
-            input_schema={
-                "type": "object",
-                "properties": {
-                    "name": {"type": "string"},
-                    "count": {"type": "integer", "default": 10},
-                },
-                "required": ["name"],
-            },
-            output_schema={},
-        )
-        result = converter.convert_descriptor(descriptor, strict=True)
-        params = result["function"]["parameters"]
-
-        # default should be removed
-        assert "default" not in params["properties"]["count"]
-
-    def test_convert_descriptor_strict_mode_nested_objects(self, converter):
+    def test_convert_descriptor_strict_mode_nested_objects(self, converter, nested_strict_descriptor):
         """Strict mode recurses into nested objects."""
-        descriptor = ModuleDescriptor(
-            module_id="test.nested_strict",
-            description="Nested strict test",
-            input_schema={
-                "type": "object",
-                "properties": {
-                    "config": {
-                        "type": "object",
-                        "properties": {
-                            "key": {"type": "string"},
-                            "value": {"type": "string"},
-                        },
-                        "required": ["key"],
-                    },
-                },
-                "required": ["config"],
-            },
-            output_schema={},
-        )
-        result = converter.convert_descriptor(descriptor, strict=True)
+        result = converter.convert_descriptor(nested_strict_descriptor, strict=True)
         nested = result["function"]["parameters"]["properties"]["config"]
 
         assert nested.get("additionalProperties") is False
@@ -254,10 +388,6 @@ class TestConvertDescriptor:
 class TestConvertRegistry:
     """Tests for OpenAIConverter.convert_registry."""
 
-    @pytest.fixture
-    def converter(self):
-        return OpenAIConverter()
-
     def test_convert_registry_multiple_modules(self, converter):
         """Converts all modules in a registry."""
         registry = StubRegistry(
@@ -286,9 +416,8 @@ class TestConvertRegistry:
         )
         results = converter.convert_registry(registry)
 
-        assert len(results) == 2
-        names = {r["function"]["name"] for r in results}
-        assert names == {"mod-a", "mod-b"}
+        # StubRegistry.list() returns ids in sorted order
+        assert [r["function"]["name"] for r in results] == ["mod-a", "mod-b"]
 
     def test_convert_registry_empty(self, converter):
         """Returns empty list for empty registry."""
@@ -299,24 +428,7 @@ class TestConvertRegistry:
 
     def test_convert_registry_tag_filter(self, converter):
         """Only includes modules matching tags."""
-        registry = StubRegistry(
-            [
-                ModuleDescriptor(
-                    module_id="image.resize",
-                    description="Resize",
-                    input_schema={"type": "object", "properties": {}},
-                    output_schema={},
-                    tags=["image", "transform"],
-                ),
-                ModuleDescriptor(
-                    module_id="text.echo",
-                    description="Echo",
-                    input_schema={"type": "object", "properties": {}},
-                    output_schema={},
-                    tags=["text"],
-                ),
-            ]
-        )
+        registry = StubRegistry([_IMAGE_RESIZE, _TEXT_ECHO])
         results = converter.convert_registry(registry, tags=["image"])
 
         assert len(results) == 1
@@ -324,24 +436,7 @@ class TestConvertRegistry:
 
     def test_convert_registry_prefix_filter(self, converter):
         """Only includes modules matching prefix."""
-        registry = StubRegistry(
-            [
-                ModuleDescriptor(
-                    module_id="image.resize",
-                    description="Resize",
-                    input_schema={"type": "object", "properties": {}},
-                    output_schema={},
-                    tags=[],
-                ),
-                ModuleDescriptor(
-                    module_id="text.echo",
-                    description="Echo",
-                    input_schema={"type": "object", "properties": {}},
-                    output_schema={},
-                    tags=[],
-                ),
-            ]
-        )
+        registry = StubRegistry([_IMAGE_RESIZE, _TEXT_ECHO])
         results = converter.convert_registry(registry, prefix="text")
 
         assert len(results) == 1
@@ -349,24 +444,10 @@ class TestConvertRegistry:
 
     def test_convert_registry_skip_none_definition(self, converter):
         """Skips when get_definition returns None (race condition)."""
-
-        class HoleyRegistry:
-            """Registry that returns None for some module IDs."""
-
-            def list(self, tags=None, prefix=None):
-                return ["mod.exists", "mod.gone"]
-
-            def get_definition(self, module_id):
-                if module_id == "mod.exists":
-                    return ModuleDescriptor(
-                        module_id="mod.exists",
-                        description="Exists",
-                        input_schema={"type": "object", "properties": {}},
-                        output_schema={},
-                    )
-                return None  # Simulate race condition
-
-        registry = HoleyRegistry()
+        registry = SimpleNamespace(
+            list=lambda tags=None, prefix=None: ["mod.exists", "mod.gone"],
+            get_definition=lambda module_id: _MOD_EXISTS if module_id == "mod.exists" else None,
+        )
         results = converter.convert_registry(registry)
 
         assert len(results) == 1
@@ -403,106 +484,98 @@ class TestConvertRegistry:
 
     def test_convert_registry_preserves_order(self, converter):
         """Results follow the order returned by registry.list()."""
-        registry = StubRegistry(
-            [
-                ModuleDescriptor(
-                    module_id="b.mod",
-                    description="B",
-                    input_schema={"type": "object", "properties": {}},
-                    output_schema={},
-                ),
-                ModuleDescriptor(
-                    module_id="a.mod",
-                    description="A",
-                    input_schema={"type": "object", "properties": {}},
-                    output_schema={},
-                ),
-            ]
-        )
+        registry = StubRegistry([_B_MOD, _A_MOD])
         results = converter.convert_registry(registry)
         names = [r["function"]["name"] for r in results]
         # StubRegistry.list() returns sorted, so a.mod comes before b.mod
         assert names == ["a-mod", "b-mod"]
 
 
-class TestStrictModeEdgeCases:
-    """Tests for strict mode edge cases in _apply_strict_recursive."""
+class TestConversionCache:
+    """Tests for memoization in OpenAIConverter.convert_descriptor."""
 
     @pytest.fixture
     def converter(self):
+        # Cache assertions need an empty cache, so don't share the module converter.
         return OpenAIConverter()
 
-    def test_strict_mode_list_type_already_has_null(self, converter):
-        """Strict mode does not duplicate 'null' when type is already a list with null."""
-        descriptor = ModuleDescriptor(
-            module_id="test.list_null",
-            description="Test",
-            input_schema={
-                "type": "object",
-                "properties": {
-                    "req_field": {"type": "string"},
-                    "opt_field": {"type": ["string", "null"]},
-                },
-                "required": ["req_field"],
-            },
-            output_schema={},
-        )
+    def test_repeat_conversion_hits_cache(self, converter, simple_descriptor):
+        first = converter.convert_descriptor(simple_descriptor, strict=True)
+        second = converter.convert_descriptor(simple_descriptor, strict=True)
 
-        result = converter.convert_descriptor(descriptor, strict=True)
-        params = result["function"]["parameters"]
-        # opt_field already has null in type list, should not duplicate
-        assert params["properties"]["opt_field"]["type"] == ["string", "null"]
+        assert first == second
+        assert len(converter._cache) == 1
 
-    def test_strict_mode_list_type_without_null(self, converter):
-        """Strict mode appends null to list type that doesn't have it."""
-        descriptor = ModuleDescriptor(
-            module_id="test.list_no_null",
-            description="Test",
-            input_schema={
-                "type": "object",
-                "properties": {
-                    "req_field": {"type": "string"},
-                    "opt_field": {"type": ["string", "integer"]},
-                },
-                "required": ["req_field"],
-            },
-            output_schema={},
-        )
+    def test_cached_result_is_a_copy(self, converter, simple_descriptor):
+        first = converter.convert_descriptor(simple_descriptor, strict=True)
+        first["function"]["parameters"]["properties"].clear()
 
-        result = converter.convert_descriptor(descriptor, strict=True)
-        params = result["function"]["parameters"]
-        assert params["properties"]["opt_field"]["type"] == [
-            "string",
-            "integer",
-            "null",
-        ]
+        second = converter.convert_descriptor(simple_descriptor, strict=True)
+        assert "width" in second["function"]["parameters"]["properties"]
 
-    def test_strict_mode_array_items_recursion(self, converter):
-        """Strict mode recurses into array items."""
-        descriptor = ModuleDescriptor(
-            module_id="test.array_recurse",
-            description="Test",
-            input_schema={
-                "type": "object",
-                "properties": {
-                    "items": {
-                        "type": "array",
-                        "items": {
-                            "type": "object",
-                            "properties": {
-                                "name": {"type": "string"},
-                                "value": {"type": "integer", "default": 0},
-                            },
-                            "required": ["name"],
-                        },
-                    },
-                },
-                "required": ["items"],
-            },
-            output_schema={},
+    def test_options_and_schema_are_part_of_key(self, converter, simple_descriptor):
+        converter.convert_descriptor(simple_descriptor, strict=True)
+        converter.convert_descriptor(simple_descriptor, strict=True, embed_annotations=True)
+        changed = dataclasses.replace(simple_descriptor, input_schema={"type": "object", "properties": {}})
+        result = converter.convert_descriptor(changed, strict=True)
+
+        assert len(converter._cache) == 3
+        assert result["function"]["parameters"]["properties"] == {}
+
+    def test_non_strict_results_are_not_cached(self, converter, simple_descriptor):
+        converter.convert_descriptor(simple_descriptor)
+        converter.convert_descriptor(simple_descriptor, embed_annotations=True)
+        assert len(converter._cache) == 0
+
+    def test_read_only_schema_is_cached(self, converter):
+        descriptor = _plain_descriptor("mod.frozen", "Frozen")
+        first = converter.convert_descriptor(descriptor, strict=True)
+        second = converter.convert_descriptor(descriptor, strict=True)
+
+        assert first == second
+        assert first["function"]["parameters"]["additionalProperties"] is False
+        assert len(converter._cache) == 1
+
+    def test_equal_schema_content_shares_an_entry(self, converter, simple_descriptor):
+        reordered = dataclasses.replace(
+            simple_descriptor, input_schema=dict(reversed(list(simple_descriptor.input_schema.items())))
         )
+        first = converter.convert_descriptor(simple_descriptor, strict=True)
+        second = converter.convert_descriptor(reordered, strict=True)
+
+        assert len(converter._cache) == 1
+        assert first == second
+        assert first is not second
+
+    def test_clear_cache(self, converter, simple_descriptor):
+        converter.convert_descriptor(simple_descriptor, strict=True)
+        converter.clear_cache()
+        assert len(converter._cache) == 0
 
+
+class TestStrictModeEdgeCases:
+    """Tests for strict mode edge cases in _apply_strict_recursive."""
+
+    @pytest.mark.parametrize(
+        "descriptor_fixture,prop,expected",
+        [
+            ("optional_field_descriptor", "required_field", {"type": "string"}),
+            ("optional_field_descriptor", "optional_field", {"type": ["integer", "null"]}),
+            ("defaults_descriptor", "count", {"type": ["integer", "null"]}),
+            ("list_type_with_null_descriptor", "opt_field", {"type": ["string", "null"]}),
+            ("list_type_without_null_descriptor", "opt_field", {"type": ["string", "integer", "null"]}),
+        ],
+        ids=["required-kept", "optional-nullable", "default-removed", "list-has-null", "list-appends-null"],
+    )
+    def test_strict_mode_property(self, converter, request, descriptor_fixture, prop, expected):
+        """Strict mode keeps required types, makes optionals nullable once, and drops defaults."""
+        descriptor = request.getfixturevalue(descriptor_fixture)
         result = converter.convert_descriptor(descriptor, strict=True)
+        assert result["function"]["parameters"]["properties"][prop] == expected
+
+    def test_strict_mode_array_items_recursion(self, converter, array_items_descriptor):
+        """Strict mode recurses into array items."""
+        result = converter.convert_descriptor(array_items_descriptor, strict=True)
         params = result["function"]["parameters"]
         item_schema = params["properties"]["items"]["items"]
         # Items should have strict mode applied too
@@ -514,53 +587,48 @@ class TestStrictModeEdgeCases:
         # Default should be removed
         assert "default" not in item_schema["properties"]["value"]
 
-    def test_strict_mode_strips_x_extensions(self, converter):
+    def test_strict_mode_strips_x_extensions(self, converter, x_extensions_descriptor):
         """to_strict_schema() strips x-* extension fields."""
-        descriptor = ModuleDescriptor(
-            module_id="test.extensions",
-            description="Test",
-            input_schema={
-                "type": "object",
-                "properties": {
-                    "name": {
-                        "type": "string",
-                        "x-llm-description": "A custom hint",
-                        "x-sensitive": True,
-                    },
-                },
-                "required": ["name"],
-            },
-            output_schema={},
-        )
-
-        result = converter.convert_descriptor(descriptor, strict=True)
+        result = converter.convert_descriptor(x_extensions_descriptor, strict=True)
         params = result["function"]["parameters"]
         # x-* fields should be stripped
         assert "x-llm-description" not in params["properties"]["name"]
         assert "x-sensitive" not in params["properties"]["name"]
 
-    def test_strict_mode_promotes_x_llm_description(self, converter):
+    def test_strict_mode_promotes_x_llm_description(self, converter, llm_description_descriptor):
         """x-llm-description is promoted to description before stripping."""
+        result = converter.convert_descriptor(llm_description_descriptor, strict=True)
+        params = result["function"]["parameters"]
+        # x-llm-description should have been promoted to description
+        assert params["properties"]["query"]["description"] == "LLM-optimized description"
+        # x-llm-description key itself should be stripped
+        assert "x-llm-description" not in params["properties"]["query"]
+
+    def test_strict_mode_promotes_x_llm_description_in_compositions(self, converter):
+        """Promotion also reaches array items and oneOf/anyOf/allOf branches."""
         descriptor = ModuleDescriptor(
-            module_id="test.llm_desc",
+            module_id="test.llm_desc_nested",
             description="Test",
             input_schema={
                 "type": "object",
                 "properties": {
-                    "query": {
-                        "type": "string",
-                        "description": "Original description",
-                        "x-llm-description": "LLM-optimized description",
+                    "tags": {
+                        "type": "array",
+                        "items": {"type": "string", "description": "Tag", "x-llm-description": "LLM tag"},
+                    },
+                    "target": {
+                        "anyOf": [
+                            {"type": "string", "description": "Path", "x-llm-description": "LLM path"},
+                            {"type": "integer", "description": "Id"},
+                        ],
                     },
                 },
-                "required": ["query"],
+                "required": ["tags", "target"],
             },
             output_schema={},
         )
 
         result = converter.convert_descriptor(descriptor, strict=True)
-        params = result["function"]["parameters"]
-        # x-llm-description should have been promoted to description
-        assert params["properties"]["query"]["description"] == "LLM-optimized description"
-        # x-llm-description key itself should be stripped
-        assert "x-llm-description" not in params["properties"]["query"]
+        props = result["function"]["parameters"]["properties"]
+        assert props["tags"]["items"]["description"] == "LLM tag"
+        assert [branch["description"] for branch in props["target"]["anyOf"]] == ["LLM path", "Id"]
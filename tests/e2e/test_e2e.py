@@ -10,6 +10,8 @@ TC-E2E-003) are skipped because they need real apcore modules.
 
 from __future__ import annotations
 
+import sys
+
 import pytest
 from mcp import types as mcp_types
 
@@ -27,15 +29,19 @@ class StubRegistry:
 
     def __init__(self, descriptors: list[ModuleDescriptor] | None = None) -> None:
         self._descriptors: dict[str, ModuleDescriptor] = {d.module_id: d for d in (descriptors or [])}
+        self._sorted_ids: list[str] = sorted(self._descriptors)
+        self._tags_by_id: dict[str, frozenset[str]] = {mid: frozenset(d.tags) for mid, d in self._descriptors.items()}
 
     def list(self, tags: list[str] | None = None, prefix: str | None = None) -> list[str]:
-        ids = list(self._descriptors.keys())
+        # Filtering preserves order, so the ids never need re-sorting.
+        ids = self._sorted_ids
         if prefix is not None:
             ids = [mid for mid in ids if mid.startswith(prefix)]
         if tags is not None:
-            tag_set = set(tags)
-            ids = [mid for mid in ids if tag_set.issubset(set(self._descriptors[mid].tags))]
-        return sorted(ids)
+            tag_set = frozenset(tags)
+            tags_by_id = self._tags_by_id
+            ids = [mid for mid in ids if tag_set <= tags_by_id[mid]]
+        return ids if ids is not self._sorted_ids else list(ids)
 
     def get_definition(self, module_id: str) -> ModuleDescriptor | None:
         return self._descriptors.get(module_id)
@@ -45,6 +51,90 @@ class StubRegistry:
 # TC-E2E-004: Multi-module registry with mixed annotations
 # ---------------------------------------------------------------------------
 
+READER_DESC = ModuleDescriptor(
+    module_id="reader.get",
+    description="Read data from a source",
+    input_schema={
+        "type": "object",
+        "properties": {
+            "source": {
+                "type": "string",
+                "description": "Data source identifier",
+            },
+            "limit": {"type": "integer", "description": "Max items to return"},
+        },
+        "required": ["source"],
+    },
+    output_schema={
+        "type": "object",
+        "properties": {"items": {"type": "array", "items": {"type": "object"}}},
+    },
+    annotations=ModuleAnnotations(readonly=True, idempotent=True),
+)
+
+WRITER_DESC = ModuleDescriptor(
+    module_id="writer.delete",
+    description="Delete records from the database",
+    input_schema={
+        "type": "object",
+        "properties": {
+            "record_id": {"type": "string", "description": "ID of the record"},
+            "force": {"type": "boolean", "description": "Force delete"},
+        },
+        "required": ["record_id"],
+    },
+    output_schema={
+        "type": "object",
+        "properties": {"deleted": {"type": "boolean"}},
+    },
+    annotations=ModuleAnnotations(destructive=True, requires_approval=True, open_world=False),
+)
+
+WORKER_DESC = ModuleDescriptor(
+    module_id="worker.process",
+    description="Process a batch of items",
+    input_schema={
+        "type": "object",
+        "properties": {
+            "batch_id": {"type": "string"},
+            "concurrency": {"type": "integer"},
+        },
+        "required": ["batch_id"],
+    },
+    output_schema={
+        "type": "object",
+        "properties": {"processed": {"type": "integer"}},
+    },
+    annotations=None,
+)
+
+REGISTRY = StubRegistry([READER_DESC, WRITER_DESC, WORKER_DESC])
+
+# Dotted names are not interned by the compiler; interning them here and in
+# tool_by_name lets each lookup match the stored key by identity.
+READER_GET = sys.intern("reader.get")
+WRITER_DELETE = sys.intern("writer.delete")
+WORKER_PROCESS = sys.intern("worker.process")
+
+# (tool name, ToolAnnotations attribute, expected value)
+ANNOTATION_CASES = [
+    # reader.get: readonly + idempotent
+    (READER_GET, "readOnlyHint", True),
+    (READER_GET, "idempotentHint", True),
+    (READER_GET, "destructiveHint", False),
+    (READER_GET, "openWorldHint", True),
+    # writer.delete: destructive, closed world
+    (WRITER_DELETE, "destructiveHint", True),
+    (WRITER_DELETE, "openWorldHint", False),
+    (WRITER_DELETE, "readOnlyHint", False),
+    (WRITER_DELETE, "idempotentHint", False),
+    # worker.process: annotations=None -> defaults
+    (WORKER_PROCESS, "readOnlyHint", False),
+    (WORKER_PROCESS, "destructiveHint", False),
+    (WORKER_PROCESS, "idempotentHint", False),
+    (WORKER_PROCESS, "openWorldHint", True),
+]
+
 
 class TestMultiModuleMixedAnnotations:
     """TC-E2E-004: Build MCP tools from a multi-module registry with varied annotations.
@@ -56,88 +146,18 @@ class TestMultiModuleMixedAnnotations:
 
     Validates that the full pipeline (MCPServerFactory with real SchemaConverter
     and AnnotationMapper) produces correct MCP ToolAnnotations for each module.
-    """
-
-    @pytest.fixture
-    def reader_desc(self) -> ModuleDescriptor:
-        return ModuleDescriptor(
-            module_id="reader.get",
-            description="Read data from a source",
-            input_schema={
-                "type": "object",
-                "properties": {
-                    "source": {
-                        "type": "string",
-                        "description": "Data source identifier",
-                    },
-                    "limit": {"type": "integer", "description": "Max items to return"},
-                },
-                "required": ["source"],
-            },
-            output_schema={
-                "type": "object",
-                "properties": {"items": {"type": "array", "items": {"type": "object"}}},
-            },
-            annotations=ModuleAnnotations(readonly=True, idempotent=True),
-        )
-
-    @pytest.fixture
-    def writer_desc(self) -> ModuleDescriptor:
-        return ModuleDescriptor(
-            module_id="writer.delete",
-            description="Delete records from the database",
-            input_schema={
-                "type": "object",
-                "properties": {
-                    "record_id": {"type": "string", "description": "ID of the record"},
-                    "force": {"type": "boolean", "description": "Force delete"},
-                },
-                "required": ["record_id"],
-            },
-            output_schema={
-                "type": "object",
-                "properties": {"deleted": {"type": "boolean"}},
-            },
-            annotations=ModuleAnnotations(destructive=True, requires_approval=True, open_world=False),
-        )
-
-    @pytest.fixture
-    def worker_desc(self) -> ModuleDescriptor:
-        return ModuleDescriptor(
-            module_id="worker.process",
-            description="Process a batch of items",
-            input_schema={
-                "type": "object",
-                "properties": {
-                    "batch_id": {"type": "string"},
-                    "concurrency": {"type": "integer"},
-                },
-                "required": ["batch_id"],
-            },
-            output_schema={
-                "type": "object",
-                "properties": {"processed": {"type": "integer"}},
-            },
-            annotations=None,
-        )
 
-    @pytest.fixture
-    def registry(
-        self,
-        reader_desc: ModuleDescriptor,
-        writer_desc: ModuleDescriptor,
-        worker_desc: ModuleDescriptor,
-    ) -> StubRegistry:
-        return StubRegistry([reader_desc, writer_desc, worker_desc])
+    The fixtures are class-scoped: build_tools() only reads the registry and
+    every test treats the built tools as read-only, so the pipeline runs once.
+    """
 
-    @pytest.fixture
-    def tools(self, registry: StubRegistry) -> list[mcp_types.Tool]:
-        factory = MCPServerFactory()
-        return factory.build_tools(registry)
+    @pytest.fixture(scope="class")
+    def tools(self, factory: MCPServerFactory) -> list[mcp_types.Tool]:
+        return factory.build_tools(REGISTRY)
 
-    @pytest.fixture
+    @pytest.fixture(scope="class")
     def tool_by_name(self, tools: list[mcp_types.Tool]) -> dict[str, mcp_types.Tool]:
-        return {t.name: t for t in tools}
+        return {sys.intern(t.name): t for t in tools}
 
     def test_three_tools_built(self, tools: list[mcp_types.Tool]) -> None:
         """All three modules produce MCP Tools."""
@@ -145,89 +165,16 @@ class TestMultiModuleMixedAnnotations:
 
     def test_tool_names(self, tool_by_name: dict[str, mcp_types.Tool]) -> None:
         """Tool names match module IDs."""
-        assert set(tool_by_name.keys()) == {
-            "reader.get",
-            "writer.delete",
-            "worker.process",
-        }
-
-    # -- reader.get annotations --
-
-    def test_reader_readonly_hint(self, tool_by_name: dict[str, mcp_types.Tool]) -> None:
-        """reader.get has readOnlyHint=True."""
-        tool = tool_by_name["reader.get"]
-        assert tool.annotations is not None
-        assert tool.annotations.readOnlyHint is True
-
-    def test_reader_idempotent_hint(self, tool_by_name: dict[str, mcp_types.Tool]) -> None:
-        """reader.get has idempotentHint=True."""
-        tool = tool_by_name["reader.get"]
-        assert tool.annotations is not None
-        assert tool.annotations.idempotentHint is True
-
-    def test_reader_destructive_hint_false(self, tool_by_name: dict[str, mcp_types.Tool]) -> None:
-        """reader.get has destructiveHint=False (default)."""
-        tool = tool_by_name["reader.get"]
-        assert tool.annotations is not None
-        assert tool.annotations.destructiveHint is False
-
-    def test_reader_open_world_hint_default(self, tool_by_name: dict[str, mcp_types.Tool]) -> None:
-        """reader.get has openWorldHint=True (default)."""
-        tool = tool_by_name["reader.get"]
-        assert tool.annotations is not None
-        assert tool.annotations.openWorldHint is True
-
-    # -- writer.delete annotations --
-
-    def test_writer_destructive_hint(self, tool_by_name: dict[str, mcp_types.Tool]) -> None:
-        """writer.delete has destructiveHint=True."""
-        tool = tool_by_name["writer.delete"]
-        assert tool.annotations is not None
-        assert tool.annotations.destructiveHint is True
-
-    def test_writer_open_world_hint_false(self, tool_by_name: dict[str, mcp_types.Tool]) -> None:
-        """writer.delete has openWorldHint=False."""
-        tool = tool_by_name["writer.delete"]
-        assert tool.annotations is not None
-        assert tool.annotations.openWorldHint is False
-
-    def test_writer_readonly_hint_false(self, tool_by_name: dict[str, mcp_types.Tool]) -> None:
-        """writer.delete has readOnlyHint=False (default)."""
-        tool = tool_by_name["writer.delete"]
-        assert tool.annotations is not None
-        assert tool.annotations.readOnlyHint is False
-
-    def test_writer_idempotent_hint_false(self, tool_by_name: dict[str, mcp_types.Tool]) -> None:
-        """writer.delete has idempotentHint=False (default)."""
-        tool = tool_by_name["writer.delete"]
-        assert tool.annotations is not None
-        assert tool.annotations.idempotentHint is False
-
-    # -- worker.process annotations (None -> defaults) --
-
-    def test_worker_default_readonly_hint(self, tool_by_name: dict[str, mcp_types.Tool]) -> None:
-        """worker.process (annotations=None) has readOnlyHint=False."""
-        tool = tool_by_name["worker.process"]
-        assert tool.annotations is not None
-        assert tool.annotations.readOnlyHint is False
-
-    def test_worker_default_destructive_hint(self, tool_by_name: dict[str, mcp_types.Tool]) -> None:
-        """worker.process (annotations=None) has destructiveHint=False."""
-        tool = tool_by_name["worker.process"]
-        assert tool.annotations is not None
-        assert tool.annotations.destructiveHint is False
-
-    def test_worker_default_idempotent_hint(self, tool_by_name: dict[str, mcp_types.Tool]) -> None:
-        """worker.process (annotations=None) has idempotentHint=False."""
-        tool = tool_by_name["worker.process"]
-        assert tool.annotations is not None
-        assert tool.annotations.idempotentHint is False
-
-    def test_worker_default_open_world_hint(self, tool_by_name: dict[str, mcp_types.Tool]) -> None:
-        """worker.process (annotations=None) has openWorldHint=True."""
-        tool = tool_by_name["worker.process"]
-        assert tool.annotations is not None
-        assert tool.annotations.openWorldHint is True
+        assert set(tool_by_name.keys()) == {READER_GET, WRITER_DELETE, WORKER_PROCESS}
+
+    @pytest.mark.parametrize("name,attr,expected", ANNOTATION_CASES)
+    def test_annotation_hint(
+        self, tool_by_name: dict[str, mcp_types.Tool], name: str, attr: str, expected: bool
+    ) -> None:
+        """Each module's annotation profile maps to the expected MCP hint."""
+        annotations = tool_by_name[name].annotations
+        assert annotations is not None
+        assert getattr(annotations, attr) is expected
 
     # -- Schema validation for all tools --
 
@@ -261,27 +208,13 @@ class TestZeroModules:
         return StubRegistry([])
 
     def test_openai_tools_returns_empty_list(self, empty_registry: StubRegistry) -> None:
-        """to_openai_tools() returns an empty list for an empty registry."""
+        """to_openai_tools() returns an empty list, not None, for an empty registry."""
         tools = to_openai_tools(empty_registry)
         assert isinstance(tools, list)
         assert tools == []
 
-    def test_build_tools_returns_empty_list(self, empty_registry: StubRegistry) -> None:
-        """MCPServerFactory.build_tools() returns an empty list for an empty registry."""
-        factory = MCPServerFactory()
+    def test_build_tools_returns_empty_list(self, empty_registry: StubRegistry, factory: MCPServerFactory) -> None:
+        """MCPServerFactory.build_tools() returns an empty list, not None, for an empty registry."""
         tools = factory.build_tools(empty_registry)
         assert isinstance(tools, list)
         assert tools == []
-
-    def test_openai_tools_return_type(self, empty_registry: StubRegistry) -> None:
-        """to_openai_tools() always returns a list, not None."""
-        result = to_openai_tools(empty_registry)
-        assert result is not None
-        assert isinstance(result, list)
-
-    def test_build_tools_return_type(self, empty_registry: StubRegistry) -> None:
-        """MCPServerFactory.build_tools() always returns a list, not None."""
-        factory = MCPServerFactory()
-        result = factory.build_tools(empty_registry)
-        assert result is not None
-        assert isinstance(result, list)
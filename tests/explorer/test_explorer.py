@@ -2,48 +2,56 @@
 
 from __future__ import annotations
 
-from dataclasses import dataclass
-from typing import Any
-from unittest.mock import AsyncMock
+from collections.abc import Iterator
+from dataclasses import dataclass, field
+from typing import TYPE_CHECKING, Any
 
 import jwt as pyjwt
 import pytest
-from starlette.applications import Starlette
-from starlette.testclient import TestClient
 
 from apcore_mcp.auth.jwt import JWTAuthenticator
 from apcore_mcp.auth.middleware import auth_identity_var
 from apcore_mcp.explorer import create_explorer_mount
 
+# Starlette's app and test client are imported inside the fixtures that build
+# them, keeping starlette.testclient off the collection path.
+if TYPE_CHECKING:
+    from starlette.applications import Starlette
+    from starlette.testclient import TestClient
+
 # ---------------------------------------------------------------------------
-# Mock MCP Tool objects
+# Mock MCP Tool objects and router stub
 # ---------------------------------------------------------------------------
 
 
-@dataclass
+@dataclass(slots=True)
 class MockToolAnnotations:
     readOnlyHint: bool | None = None  # noqa: N815
     destructiveHint: bool | None = None  # noqa: N815
     idempotentHint: bool | None = None  # noqa: N815
     openWorldHint: bool | None = None  # noqa: N815
     title: str | None = None
+    _dump: dict[str, Any] = field(init=False, repr=False, compare=False)
+
+    def __post_init__(self) -> None:
+        # Mirrors model_dump(exclude_none=True); computed once per instance.
+        self._dump = {
+            key: value
+            for key, value in (
+                ("readOnlyHint", self.readOnlyHint),
+                ("destructiveHint", self.destructiveHint),
+                ("idempotentHint", self.idempotentHint),
+                ("openWorldHint", self.openWorldHint),
+                ("title", self.title),
+            )
+            if value is not None
+        }
 
     def model_dump(self, **kwargs: Any) -> dict[str, Any]:
-        result = {}
-        if self.readOnlyHint is not None:
-            result["readOnlyHint"] = self.readOnlyHint
-        if self.destructiveHint is not None:
-            result["destructiveHint"] = self.destructiveHint
-        if self.idempotentHint is not None:
-            result["idempotentHint"] = self.idempotentHint
-        if self.openWorldHint is not None:
-            result["openWorldHint"] = self.openWorldHint
-        if self.title is not None:
-            result["title"] = self.title
-        return result
-
-
-@dataclass
+        return dict(self._dump)
+
+
+@dataclass(slots=True)
 class MockTool:
     name: str
     description: str
@@ -51,82 +59,166 @@ class MockTool:
     annotations: MockToolAnnotations | None = None
 
 
+class StubRouter:
+    """ExecutionRouter stand-in that records calls and returns a fixed result."""
+
+    def __init__(self, result: tuple[Any, ...]) -> None:
+        self.result = result
+        self.calls: list[tuple[str, dict[str, Any]]] = []
+
+    async def handle_call(self, name: str, args: dict[str, Any]) -> tuple[Any, ...]:
+        self.calls.append((name, args))
+        return self.result
+
+
 # ---------------------------------------------------------------------------
 # Fixtures
+#
+# The router, apps, and client are built once per module. The router
+# is reset before every test so call assertions and return values don't leak.
 # ---------------------------------------------------------------------------
 
-
-@pytest.fixture
-def sample_tools() -> list[MockTool]:
-    """Two sample MCP tools for testing."""
-    return [
-        MockTool(
-            name="image.resize",
-            description="Resize an image",
-            inputSchema={
-                "type": "object",
-                "properties": {
-                    "width": {"type": "integer"},
-                    "height": {"type": "integer"},
-                },
-                "required": ["width", "height"],
+# Two sample MCP tools; never mutated, so shared by every app in the module.
+SAMPLE_TOOLS = [
+    MockTool(
+        name="image.resize",
+        description="Resize an image",
+        inputSchema={
+            "type": "object",
+            "properties": {
+                "width": {"type": "integer"},
+                "height": {"type": "integer"},
             },
-            annotations=MockToolAnnotations(readOnlyHint=False, idempotentHint=True),
-        ),
-        MockTool(
-            name="text.echo",
-            description="Echo input text",
-            inputSchema={
-                "type": "object",
-                "properties": {"text": {"type": "string"}},
-                "required": ["text"],
-            },
-            annotations=MockToolAnnotations(readOnlyHint=True),
-        ),
-    ]
+            "required": ["width", "height"],
+        },
+        annotations=MockToolAnnotations(readOnlyHint=False, idempotentHint=True),
+    ),
+    MockTool(
+        name="text.echo",
+        description="Echo input text",
+        inputSchema={
+            "type": "object",
+            "properties": {"text": {"type": "string"}},
+            "required": ["text"],
+        },
+        annotations=MockToolAnnotations(readOnlyHint=True),
+    ),
+]
+
+_DEFAULT_ROUTER_RESULT = (
+    [{"type": "text", "text": '{"result": "ok"}'}],
+    False,
+    "trace-abc",
+)
+
+
+@pytest.fixture(scope="module")
+def mock_router() -> StubRouter:
+    """Stub ExecutionRouter with handle_call returning success."""
+    return StubRouter(_DEFAULT_ROUTER_RESULT)
+
+
+@pytest.fixture(autouse=True)
+def _reset_router(mock_router: StubRouter) -> None:
+    mock_router.calls.clear()
+    mock_router.result = _DEFAULT_ROUTER_RESULT
 
 
 @pytest.fixture
-def mock_router() -> AsyncMock:
-    """Mock ExecutionRouter with handle_call returning success."""
-    router = AsyncMock()
-    router.handle_call.return_value = (
-        [{"type": "text", "text": '{"result": "ok"}'}],
-        False,
-        "trace-abc",
-    )
-    return router
+def router_result(request: pytest.FixtureRequest, mock_router: StubRouter) -> tuple[Any, ...]:
+    """Per-test handle_call result, supplied via indirect parametrization."""
+    mock_router.result = request.param
+    return request.param
 
 
-@pytest.fixture
-def explorer_app(sample_tools: list[MockTool], mock_router: AsyncMock) -> Starlette:
-    """Starlette app with explorer mounted at /explorer, allow_execute=True."""
-    mount = create_explorer_mount(sample_tools, mock_router, allow_execute=True, explorer_prefix="/explorer")
+@pytest.fixture(scope="module")
+def explorer_app(request: pytest.FixtureRequest, mock_router: StubRouter) -> Starlette:
+    """Starlette app with explorer mounted at /explorer.
+
+    allow_execute defaults to True; parametrize indirectly with False to
+    disable execution.
+    """
+    from starlette.applications import Starlette
+
+    allow_execute = getattr(request, "param", True)
+    mount = create_explorer_mount(SAMPLE_TOOLS, mock_router, allow_execute=allow_execute, explorer_prefix="/explorer")
     return Starlette(routes=[mount])
 
 
-@pytest.fixture
-def explorer_app_no_execute(sample_tools: list[MockTool], mock_router: AsyncMock) -> Starlette:
-    """Starlette app with explorer mounted, allow_execute=False."""
-    mount = create_explorer_mount(sample_tools, mock_router, allow_execute=False, explorer_prefix="/explorer")
+@pytest.fixture(scope="module")
+def client(explorer_app: Starlette) -> Iterator[TestClient]:
+    from starlette.testclient import TestClient
+
+    with TestClient(explorer_app) as c:
+        yield c
+
+
+# GET responses depend only on the module-scoped tools, so each unique
+# request is made once and its parsed body shared by the tests that read it.
+@pytest.fixture(scope="module")
+def tools_list_json(client: TestClient) -> list[dict[str, Any]]:
+    response = client.get("/explorer/tools")
+    assert response.status_code == 200
+    return response.json()
+
+
+@pytest.fixture(scope="module")
+def resize_detail_json(client: TestClient) -> dict[str, Any]:
+    response = client.get("/explorer/tools/image.resize")
+    assert response.status_code == 200
+    return response.json()
+
+
+@pytest.fixture(scope="module")
+def custom_prefix_app(mock_router: StubRouter) -> Starlette:
+    """Starlette app with explorer mounted at /custom."""
+    from starlette.applications import Starlette
+
+    mount = create_explorer_mount(SAMPLE_TOOLS, mock_router, explorer_prefix="/custom")
     return Starlette(routes=[mount])
 
 
+@pytest.fixture(scope="module")
+def custom_prefix_client(custom_prefix_app: Starlette) -> Iterator[TestClient]:
+    from starlette.testclient import TestClient
+
+    with TestClient(custom_prefix_app) as c:
+        yield c
+
+
+@pytest.fixture(scope="module")
+def unmounted_app() -> Starlette:
+    """App without the explorer mounted."""
+    from starlette.applications import Starlette
+
+    return Starlette(routes=[])
+
+
+def _is_routed(app: Starlette, path: str) -> bool:
+    """Whether any route fully matches a GET to *path*.
+
+    Resolving against the router directly checks for a 404 without an HTTP
+    roundtrip through TestClient.
+    """
+    from starlette.routing import Match
+
+    scope = {"type": "http", "method": "GET", "path": path, "root_path": ""}
+    return any(route.matches(scope)[0] == Match.FULL for route in app.router.routes)
+
+
 # ---------------------------------------------------------------------------
 # TC-001: GET /explorer/ returns HTML 200 with self-contained page
 # ---------------------------------------------------------------------------
 
 
 class TestTC001ExplorerPage:
-    def test_explorer_page_returns_html(self, explorer_app: Starlette) -> None:
-        client = TestClient(explorer_app)
+    def test_explorer_page_returns_html(self, client: TestClient) -> None:
         response = client.get("/explorer/")
         assert response.status_code == 200
         assert "text/html" in response.headers["content-type"]
         assert "APCore MCP Tool Explorer" in response.text
 
-    def test_explorer_page_is_self_contained(self, explorer_app: Starlette) -> None:
-        client = TestClient(explorer_app)
+    def test_explorer_page_is_self_contained(self, client: TestClient) -> None:
         response = client.get("/explorer/")
         assert "<style>" in response.text
         assert "<script>" in response.text
@@ -138,19 +230,13 @@ class TestTC001ExplorerPage:
 
 
 class TestTC002ExplorerDisabledByDefault:
-    def test_no_explorer_when_not_mounted(self) -> None:
+    def test_no_explorer_when_not_mounted(self, unmounted_app: Starlette) -> None:
         """When explorer is not mounted, /explorer/ should 404."""
-        app = Starlette(routes=[])
-        client = TestClient(app, raise_server_exceptions=False)
-        response = client.get("/explorer/")
-        assert response.status_code == 404
+        assert not _is_routed(unmounted_app, "/explorer/")
 
-    def test_no_explorer_tools_when_not_mounted(self) -> None:
+    def test_no_explorer_tools_when_not_mounted(self, unmounted_app: Starlette) -> None:
         """When explorer is not mounted, /explorer/tools should 404."""
-        app = Starlette(routes=[])
-        client = TestClient(app, raise_server_exceptions=False)
-        response = client.get("/explorer/tools")
-        assert response.status_code == 404
+        assert not _is_routed(unmounted_app, "/explorer/tools")
 
 
 # ---------------------------------------------------------------------------
@@ -159,32 +245,32 @@ class TestTC002ExplorerDisabledByDefault:
 
 
 class TestTC003ListTools:
-    def test_list_tools_returns_json_array(self, explorer_app: Starlette) -> None:
-        client = TestClient(explorer_app)
+    def test_list_tools_returns_json_array(self, client: TestClient) -> None:
         response = client.get("/explorer/tools")
         assert response.status_code == 200
         data = response.json()
         assert isinstance(data, list)
         assert len(data) == 2
 
-    def test_list_tools_has_correct_fields(self, explorer_app: Starlette) -> None:
-        client = TestClient(explorer_app)
-        response = client.get("/explorer/tools")
-        data = response.json()
-        tool = data[0]
+    def test_list_tools_has_correct_fields(self, tools_list_json: list[dict[str, Any]]) -> None:
+        tool = tools_list_json[0]
         assert "name" in tool
         assert "description" in tool
         assert tool["name"] == "image.resize"
         assert tool["description"] == "Resize an image"
 
-    def test_list_tools_includes_annotations(self, explorer_app: Starlette) -> None:
-        client = TestClient(explorer_app)
-        response = client.get("/explorer/tools")
-        data = response.json()
-        tool = data[0]
+    def test_list_tools_includes_annotations(self, tools_list_json: list[dict[str, Any]]) -> None:
+        tool = tools_list_json[0]
         assert "annotations" in tool
         assert tool["annotations"]["idempotentHint"] is True
 
+    def test_list_tools_body_is_stable_across_requests(self, client: TestClient) -> None:
+        first = client.get("/explorer/tools")
+        second = client.get("/explorer/tools")
+        assert first.content == second.content
+        assert first.headers["content-type"] == "application/json"
+        assert first.headers["content-length"] == str(len(first.content))
+
 
 # ---------------------------------------------------------------------------
 # TC-004: GET /explorer/tools/<name> returns detail + 404 for unknown
@@ -192,25 +278,18 @@ class TestTC003ListTools:
 
 
 class TestTC004ToolDetail:
-    def test_tool_detail_returns_full_info(self, explorer_app: Starlette) -> None:
-        client = TestClient(explorer_app)
-        response = client.get("/explorer/tools/image.resize")
-        assert response.status_code == 200
-        data = response.json()
+    def test_tool_detail_returns_full_info(self, resize_detail_json: dict[str, Any]) -> None:
+        data = resize_detail_json
         assert data["name"] == "image.resize"
         assert data["description"] == "Resize an image"
         assert "inputSchema" in data
         assert "properties" in data["inputSchema"]
 
-    def test_tool_detail_includes_annotations(self, explorer_app: Starlette) -> None:
-        client = TestClient(explorer_app)
-        response = client.get("/explorer/tools/image.resize")
-        data = response.json()
-        assert "annotations" in data
-        assert data["annotations"]["idempotentHint"] is True
+    def test_tool_detail_includes_annotations(self, resize_detail_json: dict[str, Any]) -> None:
+        assert "annotations" in resize_detail_json
+        assert resize_detail_json["annotations"]["idempotentHint"] is True
 
-    def test_tool_detail_404_for_unknown(self, explorer_app: Starlette) -> None:
-        client = TestClient(explorer_app)
+    def test_tool_detail_404_for_unknown(self, client: TestClient) -> None:
         response = client.get("/explorer/tools/nonexistent.tool")
         assert response.status_code == 404
         data = response.json()
@@ -225,10 +304,9 @@ class TestTC004ToolDetail:
 class TestTC005CallTool:
     def test_call_tool_executes(
         self,
-        explorer_app: Starlette,
-        mock_router: AsyncMock,
+        client: TestClient,
+        mock_router: StubRouter,
     ) -> None:
-        client = TestClient(explorer_app)
         response = client.post(
             "/explorer/tools/image.resize/call",
             json={"width": 100, "height": 200},
@@ -237,31 +315,29 @@ class TestTC005CallTool:
         data = response.json()
         assert "content" in data
         assert data["isError"] is False
-        mock_router.handle_call.assert_called_once_with("image.resize", {"width": 100, "height": 200})
+        assert mock_router.calls == [("image.resize", {"width": 100, "height": 200})]
 
     def test_call_tool_404_for_unknown(
         self,
-        explorer_app: Starlette,
+        client: TestClient,
     ) -> None:
-        client = TestClient(explorer_app)
         response = client.post(
             "/explorer/tools/nonexistent.tool/call",
             json={},
         )
         assert response.status_code == 404
 
+    @pytest.mark.parametrize(
+        "router_result",
+        [([{"type": "text", "text": '{"id": 1, "title": "Buy milk"}'}], False, "abc-123")],
+        indirect=True,
+    )
     def test_call_tool_returns_mcp_format(
         self,
-        explorer_app: Starlette,
-        mock_router: AsyncMock,
+        client: TestClient,
+        router_result: tuple[Any, ...],
     ) -> None:
         """Response follows MCP CallToolResult format with content, isError, and _meta."""
-        mock_router.handle_call.return_value = (
-            [{"type": "text", "text": '{"id": 1, "title": "Buy milk"}'}],
-            False,
-            "abc-123",
-        )
-        client = TestClient(explorer_app)
         response = client.post(
             "/explorer/tools/image.resize/call",
             json={"width": 100, "height": 200},
@@ -273,17 +349,16 @@ class TestTC005CallTool:
         assert data["content"][0]["type"] == "text"
         assert data["_meta"]["_trace_id"] == "abc-123"
 
+    @pytest.mark.parametrize(
+        "router_result",
+        [([{"type": "text", "text": "Module not found"}], True, None)],
+        indirect=True,
+    )
     def test_call_tool_returns_error_on_failure(
         self,
-        explorer_app: Starlette,
-        mock_router: AsyncMock,
+        client: TestClient,
+        router_result: tuple[Any, ...],
     ) -> None:
-        mock_router.handle_call.return_value = (
-            [{"type": "text", "text": "Module not found"}],
-            True,
-            None,
-        )
-        client = TestClient(explorer_app)
         response = client.post(
             "/explorer/tools/image.resize/call",
             json={},
@@ -294,42 +369,13 @@ class TestTC005CallTool:
         assert isinstance(data["content"], list)
 
 
-# ---------------------------------------------------------------------------
-# TC-006: Call returns 403 when allow_execute=False
-# ---------------------------------------------------------------------------
-
-
-class TestTC006ExecuteDisabled:
-    def test_call_returns_403_when_disabled(
-        self,
-        explorer_app_no_execute: Starlette,
-    ) -> None:
-        client = TestClient(explorer_app_no_execute)
-        response = client.post(
-            "/explorer/tools/image.resize/call",
-            json={"width": 100, "height": 200},
-        )
-        assert response.status_code == 403
-        data = response.json()
-        assert "error" in data
-        assert "disabled" in data["error"].lower() or "allow-execute" in data["error"].lower()
-
-    def test_list_and_detail_still_work_when_execute_disabled(
-        self,
-        explorer_app_no_execute: Starlette,
-    ) -> None:
-        client = TestClient(explorer_app_no_execute)
-        assert client.get("/explorer/tools").status_code == 200
-        assert client.get("/explorer/tools/image.resize").status_code == 200
-
-
 # ---------------------------------------------------------------------------
 # TC-007: Explorer ignored for stdio (no error)
 # ---------------------------------------------------------------------------
 
 
 class TestTC007StdioIgnored:
-    def test_explorer_flag_does_not_error_for_stdio(self) -> None:
+    def test_explorer_flag_does_not_error_for_stdio(self, mock_router: StubRouter) -> None:
         """When transport is stdio, explorer=True should not cause errors
         in serve() parameter validation. We test by verifying create_explorer_mount
         works and serve() validation accepts the params without transport error."""
@@ -344,8 +390,7 @@ class TestTC007StdioIgnored:
                 inputSchema={"type": "object", "properties": {}},
             )
         ]
-        router = AsyncMock()
-        mount = create_explorer_mount(tools, router)
+        mount = create_explorer_mount(tools, mock_router)
         assert mount is not None
 
 
@@ -360,15 +405,13 @@ class TestTC007StdioIgnored:
 
 
 class TestTC008CurlAndTabs:
-    def test_explorer_page_contains_curl_css(self, explorer_app: Starlette) -> None:
-        client = TestClient(explorer_app)
+    def test_explorer_page_contains_curl_css(self, client: TestClient) -> None:
         response = client.get("/explorer/")
         assert ".curl-block" in response.text
         assert ".copy-btn" in response.text
         assert ".curl-section" in response.text
 
-    def test_explorer_page_contains_tab_css(self, explorer_app: Starlette) -> None:
-        client = TestClient(explorer_app)
+    def test_explorer_page_contains_tab_css(self, client: TestClient) -> None:
         response = client.get("/explorer/")
         assert ".resp-tab" in response.text
         assert ".resp-pane" in response.text
@@ -376,43 +419,55 @@ class TestTC008CurlAndTabs:
 
 
 # ---------------------------------------------------------------------------
-# TC-009: Custom explorer_prefix mounts at /custom/
+# TC-006: Call returns 403 when allow_execute=False
 # ---------------------------------------------------------------------------
 
 
-class TestTC009CustomPrefix:
-    def test_custom_prefix(
+@pytest.mark.parametrize("explorer_app", [False], indirect=True, ids=["no-execute"])
+class TestTC006ExecuteDisabled:
+    def test_call_returns_403_when_disabled(
         self,
-        sample_tools: list[MockTool],
-        mock_router: AsyncMock,
+        client: TestClient,
     ) -> None:
-        mount = create_explorer_mount(sample_tools, mock_router, explorer_prefix="/custom")
-        app = Starlette(routes=[mount])
-        client = TestClient(app)
+        response = client.post(
+            "/explorer/tools/image.resize/call",
+            json={"width": 100, "height": 200},
+        )
+        assert response.status_code == 403
+        data = response.json()
+        assert "error" in data
+        assert "disabled" in data["error"].lower() or "allow-execute" in data["error"].lower()
+
+    def test_list_and_detail_still_work_when_execute_disabled(
+        self,
+        client: TestClient,
+    ) -> None:
+        assert client.get("/explorer/tools").status_code == 200
+        assert client.get("/explorer/tools/image.resize").status_code == 200
 
+
+# ---------------------------------------------------------------------------
+# TC-009: Custom explorer_prefix mounts at /custom/
+# ---------------------------------------------------------------------------
+
+
+class TestTC009CustomPrefix:
+    def test_custom_prefix(self, custom_prefix_client: TestClient) -> None:
         # Should be accessible at /custom/
-        response = client.get("/custom/")
+        response = custom_prefix_client.get("/custom/")
         assert response.status_code == 200
         assert "APCore MCP Tool Explorer" in response.text
 
         # /custom/tools should work
-        response = client.get("/custom/tools")
+        response = custom_prefix_client.get("/custom/tools")
         assert response.status_code == 200
         data = response.json()
         assert len(data) == 2
 
-    def test_default_prefix_not_accessible_with_custom(
-        self,
-        sample_tools: list[MockTool],
-        mock_router: AsyncMock,
-    ) -> None:
-        mount = create_explorer_mount(sample_tools, mock_router, explorer_prefix="/custom")
-        app = Starlette(routes=[mount])
-        client = TestClient(app, raise_server_exceptions=False)
-
+    def test_default_prefix_not_accessible_with_custom(self, custom_prefix_app: Starlette) -> None:
         # /explorer/ should 404 when custom prefix is used
-        response = client.get("/explorer/")
-        assert response.status_code == 404
+        assert _is_routed(custom_prefix_app, "/custom/")
+        assert not _is_routed(custom_prefix_app, "/explorer/")
 
 
 # ---------------------------------------------------------------------------
@@ -428,11 +483,13 @@ def _make_token(payload: dict, key: str = SECRET) -> str:
 
 class TestTC010ExplorerAuth:
     @pytest.fixture
-    def auth_explorer_app(self, sample_tools: list[MockTool], mock_router: AsyncMock) -> Starlette:
+    def auth_explorer_app(self, mock_router: StubRouter) -> Starlette:
         """Explorer app with authenticator enabled."""
+        from starlette.applications import Starlette
+
         authenticator = JWTAuthenticator(key=SECRET)
         mount = create_explorer_mount(
-            sample_tools,
+            SAMPLE_TOOLS,
             mock_router,
             allow_execute=True,
             explorer_prefix="/explorer",
@@ -440,30 +497,35 @@ class TestTC010ExplorerAuth:
         )
         return Starlette(routes=[mount])
 
-    def test_page_loads_without_token(self, auth_explorer_app: Starlette) -> None:
+    @pytest.fixture
+    def auth_client(self, auth_explorer_app: Starlette) -> TestClient:
+        from starlette.testclient import TestClient
+
+        return TestClient(auth_explorer_app)
+
+    def test_page_loads_without_token(self, auth_client: TestClient) -> None:
         """Explorer pages should be accessible without auth (exempt from middleware)."""
-        client = TestClient(auth_explorer_app)
-        assert client.get("/explorer/").status_code == 200
-        assert client.get("/explorer/tools").status_code == 200
+        assert auth_client.get("/explorer/").status_code == 200
+        assert auth_client.get("/explorer/tools").status_code == 200
 
     def test_call_tool_sets_identity_with_token(
         self,
-        auth_explorer_app: Starlette,
-        mock_router: AsyncMock,
+        auth_client: TestClient,
+        mock_router: StubRouter,
+        monkeypatch: pytest.MonkeyPatch,
     ) -> None:
         """When Authorization header is provided, identity should be set via ContextVar."""
         captured_identity = []
-        return_value = mock_router.handle_call.return_value
+        return_value = mock_router.result
 
         async def capture_handle_call(name: str, args: dict) -> Any:
             captured_identity.append(auth_identity_var.get())
             return return_value
 
-        mock_router.handle_call = capture_handle_call
+        monkeypatch.setattr(mock_router, "handle_call", capture_handle_call)
 
         token = _make_token({"sub": "explorer-user", "roles": ["viewer"]})
-        client = TestClient(auth_explorer_app)
-        response = client.post(
+        response = auth_client.post(
             "/explorer/tools/image.resize/call",
             json={"width": 100, "height": 200},
             headers={"Authorization": f"Bearer {token}"},
@@ -476,12 +538,11 @@ class TestTC010ExplorerAuth:
 
     def test_call_tool_returns_401_without_token(
         self,
-        auth_explorer_app: Starlette,
-        mock_router: AsyncMock,
+        auth_client: TestClient,
+        mock_router: StubRouter,
     ) -> None:
         """Without Authorization header, tool execution should return 401."""
-        client = TestClient(auth_explorer_app)
-        response = client.post(
+        response = auth_client.post(
             "/explorer/tools/image.resize/call",
             json={"width": 100, "height": 200},
         )
@@ -489,42 +550,39 @@ class TestTC010ExplorerAuth:
         data = response.json()
         assert data["error"] == "Unauthorized"
         assert response.headers.get("www-authenticate") == "Bearer"
-        mock_router.handle_call.assert_not_called()
+        assert mock_router.calls == []
 
     def test_call_tool_returns_401_with_invalid_token(
         self,
-        auth_explorer_app: Starlette,
-        mock_router: AsyncMock,
+        auth_client: TestClient,
+        mock_router: StubRouter,
     ) -> None:
         """With an invalid token, tool execution should return 401."""
-        client = TestClient(auth_explorer_app)
-        response = client.post(
+        response = auth_client.post(
             "/explorer/tools/image.resize/call",
             json={"width": 100, "height": 200},
             headers={"Authorization": "Bearer bad.token.here"},
         )
         assert response.status_code == 401
-        mock_router.handle_call.assert_not_called()
+        assert mock_router.calls == []
 
     def test_auth_identity_var_reset_after_call(
         self,
-        auth_explorer_app: Starlette,
-        mock_router: AsyncMock,
+        auth_client: TestClient,
+        mock_router: StubRouter,
     ) -> None:
         """ContextVar should be reset after request completes."""
         token = _make_token({"sub": "temp-user"})
-        client = TestClient(auth_explorer_app)
-        client.post(
+        auth_client.post(
             "/explorer/tools/image.resize/call",
             json={},
             headers={"Authorization": f"Bearer {token}"},
         )
         assert auth_identity_var.get() is None
 
-    def test_html_contains_auth_bar(self, auth_explorer_app: Starlette) -> None:
+    def test_html_contains_auth_bar(self, auth_client: TestClient) -> None:
         """Explorer HTML should contain the authorization input UI."""
-        client = TestClient(auth_explorer_app)
-        response = client.get("/explorer/")
+        response = auth_client.get("/explorer/")
         assert "auth-bar" in response.text
         assert "auth-token" in response.text
         assert "Authorization" in response.text
@@ -7,7 +7,12 @@ and only mock the external boundary (Executor, Registry).
 
 from __future__ import annotations
 
+import asyncio
+import bisect
+import itertools
 import json
+from collections.abc import Iterable
+from types import MappingProxyType
 from typing import Any
 
 import pytest
@@ -19,6 +24,33 @@ from apcore_mcp.server.listener import RegistryListener
 from apcore_mcp.server.router import ExecutionRouter
 from tests.conftest import ModuleAnnotations, ModuleDescriptor
 
+# Router results carry JSON text; decode it with orjson when it is installed,
+# otherwise with one reusable stdlib decoder.
+try:
+    import orjson
+
+    _loads = orjson.loads
+except ImportError:
+    _loads = json.JSONDecoder().decode
+
+
+def _assert_json_equals(content: list[dict[str, Any]], expected: Any) -> None:
+    """Assert that the first content entry's JSON payload decodes to *expected*."""
+    assert _loads(content[0]["text"]) == expected
+
+
+def _read_only(schema: dict[str, Any]) -> MappingProxyType[str, Any]:
+    """Wrap *schema* and every nested dict in a read-only mapping.
+
+    Class-scoped descriptors share their schemas across tests; a converter
+    that mutated its input would raise here instead of leaking into later
+    tests.
+    """
+    return MappingProxyType(
+        {key: _read_only(value) if isinstance(value, dict) else value for key, value in schema.items()}
+    )
+
+
 # ---------------------------------------------------------------------------
 # Stubs: only mock the external boundary
 # ---------------------------------------------------------------------------
@@ -29,15 +61,22 @@ class StubRegistry:
 
     def __init__(self, descriptors: list[ModuleDescriptor] | None = None) -> None:
         self._descriptors: dict[str, ModuleDescriptor] = {d.module_id: d for d in (descriptors or [])}
+        self._sorted_ids: list[str] = sorted(self._descriptors)
+        self._by_tag: dict[str, set[str]] = {}
+        for mid, descriptor in self._descriptors.items():
+            for tag in descriptor.tags:
+                self._by_tag.setdefault(tag, set()).add(mid)
 
     def list(self, tags: list[str] | None = None, prefix: str | None = None) -> list[str]:
-        ids = list(self._descriptors.keys())
+        ids = self._sorted_ids
         if prefix is not None:
-            ids = [mid for mid in ids if mid.startswith(prefix)]
-        if tags is not None:
-            tag_set = set(tags)
-            ids = [mid for mid in ids if tag_set.issubset(set(self._descriptors[mid].tags))]
-        return sorted(ids)
+            # Matching ids form one contiguous run in sorted order.
+            start = bisect.bisect_left(ids, prefix)
+            ids = list(itertools.takewhile(lambda mid: mid.startswith(prefix), ids[start:]))
+        if tags:
+            tagged = set.intersection(*(self._by_tag.get(tag, set()) for tag in tags))
+            ids = [mid for mid in ids if mid in tagged]
+        return list(ids)
 
     def get_definition(self, module_id: str) -> ModuleDescriptor | None:
         return self._descriptors.get(module_id)
@@ -60,6 +99,25 @@ class StubExecutor:
         return self._results.get(module_id, {"ok": True})
 
 
+class StrictExecutor:
+    """Executor that only knows about specific modules; raises for unknown."""
+
+    def __init__(self, known: dict[str, Any]) -> None:
+        self._known = known
+
+    async def call_async(self, module_id: str, inputs: Any = None) -> Any:
+        if module_id not in self._known:
+            raise RuntimeError(f"Module not found: {module_id}")
+        return self._known[module_id]
+
+
+class RaisingExecutor:
+    """Executor that raises for every module."""
+
+    async def call_async(self, module_id: str, inputs: Any = None) -> Any:
+        raise RuntimeError(f"Module not found: {module_id}")
+
+
 class StubACLDeniedError(Exception):
     """Stub for apcore ACLDeniedError with code/message/details attributes."""
 
@@ -70,12 +128,17 @@ class StubACLDeniedError(Exception):
         self.details = None
 
 
+# Stateless, so every executor that denies access raises the same instance.
+_ACL_DENIED_ERROR = StubACLDeniedError()
+
+
 class EventRegistry:
     """Stub Registry with event callback support for RegistryListener tests."""
 
     def __init__(self) -> None:
         self._callbacks: dict[str, list[Any]] = {}
         self._definitions: dict[str, ModuleDescriptor] = {}
+        self._sorted_ids: list[str] = []
 
     def on(self, event: str, callback: Any) -> None:
         self._callbacks.setdefault(event, []).append(callback)
@@ -84,14 +147,20 @@ class EventRegistry:
         return self._definitions.get(module_id)
 
     def add_definition(self, descriptor: ModuleDescriptor) -> None:
+        if descriptor.module_id not in self._definitions:
+            bisect.insort(self._sorted_ids, descriptor.module_id)
         self._definitions[descriptor.module_id] = descriptor
 
+    def add_many(self, descriptors: Iterable[ModuleDescriptor]) -> None:
+        self._definitions.update({d.module_id: d for d in descriptors})
+        self._sorted_ids = sorted(self._definitions)
+
     def trigger(self, event: str, module_id: str, module: Any = None) -> None:
         for cb in self._callbacks.get(event, []):
             cb(module_id, module)
 
     def list(self, tags: list[str] | None = None, prefix: str | None = None) -> list[str]:
-        return sorted(self._definitions.keys())
+        return list(self._sorted_ids)
 
 
 # ---------------------------------------------------------------------------
@@ -104,66 +173,70 @@ class TestFullMCPFlow:
 
     Uses real SchemaConverter, AnnotationMapper, ErrorMapper, MCPServerFactory,
     and ExecutionRouter. Only the Executor and Registry are stubbed.
+
+    The fixtures are class-scoped: the registry, executor, and router are
+    never mutated, so one set serves every test. The factory is the shared
+    conftest instance.
     """
 
-    @pytest.fixture
+    @pytest.fixture(scope="class")
     def descriptor(self) -> ModuleDescriptor:
         return ModuleDescriptor(
             module_id="image.resize",
             description="Resize an image",
-            input_schema={
-                "type": "object",
-                "properties": {
-                    "width": {"type": "integer", "description": "Target width"},
-                    "height": {"type": "integer", "description": "Target height"},
-                },
-                "required": ["width"],
-            },
-            output_schema={
-                "type": "object",
-                "properties": {"status": {"type": "string"}},
-            },
+            input_schema=_read_only(
+                {
+                    "type": "object",
+                    "properties": {
+                        "width": {"type": "integer", "description": "Target width"},
+                        "height": {"type": "integer", "description": "Target height"},
+                    },
+                    "required": ["width"],
+                }
+            ),
+            output_schema=_read_only(
+                {
+                    "type": "object",
+                    "properties": {"status": {"type": "string"}},
+                }
+            ),
             tags=["image"],
             annotations=ModuleAnnotations(idempotent=True),
         )
 
-    @pytest.fixture
+    @pytest.fixture(scope="class")
     def registry(self, descriptor: ModuleDescriptor) -> StubRegistry:
         return StubRegistry([descriptor])
 
-    @pytest.fixture
-    def factory(self) -> MCPServerFactory:
-        return MCPServerFactory()
-
-    @pytest.fixture
+    @pytest.fixture(scope="class")
     def executor(self) -> StubExecutor:
         return StubExecutor(results={"image.resize": {"status": "ok"}})
 
-    @pytest.fixture
+    @pytest.fixture(scope="class")
     def router(self, executor: StubExecutor) -> ExecutionRouter:
         return ExecutionRouter(executor)
 
-    def test_build_tools_returns_one_tool(self, factory: MCPServerFactory, registry: StubRegistry) -> None:
+    @pytest.fixture(scope="class")
+    def tools(self, factory: MCPServerFactory, registry: StubRegistry) -> list[mcp_types.Tool]:
+        return factory.build_tools(registry)
+
+    def test_build_tools_returns_one_tool(self, tools: list[mcp_types.Tool]) -> None:
         """Registry with one module produces one MCP Tool."""
-        tools = factory.build_tools(registry)
         assert len(tools) == 1
 
-    def test_tool_name_matches_module_id(self, factory: MCPServerFactory, registry: StubRegistry) -> None:
+    def test_tool_name_matches_module_id(self, tools: list[mcp_types.Tool]) -> None:
         """The MCP tool name is the module_id."""
-        tools = factory.build_tools(registry)
         assert tools[0].name == "image.resize"
 
-    def test_tool_has_correct_schema(self, factory: MCPServerFactory, registry: StubRegistry) -> None:
+    def test_tool_has_correct_schema(self, tools: list[mcp_types.Tool]) -> None:
         """The tool inputSchema preserves the module's input_schema structure."""
-        tools = factory.build_tools(registry)
         schema = tools[0].inputSchema
         assert schema["type"] == "object"
         assert "width" in schema["properties"]
         assert "height" in schema["properties"]
 
-    def test_tool_has_correct_annotations(self, factory: MCPServerFactory, registry: StubRegistry) -> None:
+    def test_tool_has_correct_annotations(self, tools: list[mcp_types.Tool]) -> None:
         """Annotations are properly mapped from ModuleAnnotations to ToolAnnotations."""
-        tools = factory.build_tools(registry)
         assert tools[0].annotations is not None
         assert tools[0].annotations.idempotentHint is True
 
@@ -178,26 +251,21 @@ class TestFullMCPFlow:
         """The router result JSON contains the executor's return value."""
         content, is_error, trace_id = await router.handle_call("image.resize", {"width": 800})
         assert is_error is False
-        parsed = json.loads(content[0]["text"])
-        assert parsed == {"status": "ok"}
+        _assert_json_equals(content, {"status": "ok"})
 
     async def test_full_flow_end_to_end(
         self,
-        factory: MCPServerFactory,
-        registry: StubRegistry,
+        tools: list[mcp_types.Tool],
         router: ExecutionRouter,
     ) -> None:
         """Full flow: build tools from registry, then call router, assert success."""
-        # Build tools
-        tools = factory.build_tools(registry)
         assert len(tools) == 1
         assert tools[0].name == "image.resize"
 
         # Call through router
         content, is_error, trace_id = await router.handle_call("image.resize", {"width": 800})
         assert is_error is False
-        parsed = json.loads(content[0]["text"])
-        assert parsed == {"status": "ok"}
+        _assert_json_equals(content, {"status": "ok"})
 
 
 # ---------------------------------------------------------------------------
@@ -230,62 +298,14 @@ class TestErrorFlowNonExistentTool:
     def registry(self, descriptor: ModuleDescriptor) -> StubRegistry:
         return StubRegistry([descriptor])
 
-    async def test_nonexistent_tool_returns_error(self) -> None:
-        """Calling a tool that does not exist in the executor returns is_error=True."""
-
-        class StrictExecutor:
-            """Executor that only knows about specific modules; raises for unknown."""
-
-            def __init__(self, known: dict[str, Any]) -> None:
-                self._known = known
-
-            async def call_async(self, module_id: str, inputs: Any = None) -> Any:
-                if module_id not in self._known:
-                    raise RuntimeError(f"Module not found: {module_id}")
-                return self._known[module_id]
-
-        executor = StrictExecutor(known={"image.resize": {"status": "ok"}})
-        router = ExecutionRouter(executor)
-
-        content, is_error, trace_id = await router.handle_call("nonexistent.tool", {"key": "value"})
-
-        assert is_error is True
-
-    async def test_nonexistent_tool_error_has_text_content(self) -> None:
-        """The error response contains a text content entry with an error message."""
-
-        class StrictExecutor:
-            """Executor that only knows about specific modules; raises for unknown."""
-
-            def __init__(self, known: dict[str, Any]) -> None:
-                self._known = known
-
-            async def call_async(self, module_id: str, inputs: Any = None) -> Any:
-                if module_id not in self._known:
-                    raise RuntimeError(f"Module not found: {module_id}")
-                return self._known[module_id]
-
-        executor = StrictExecutor(known={"image.resize": {"status": "ok"}})
-        router = ExecutionRouter(executor)
-
-        content, is_error, trace_id = await router.handle_call("nonexistent.tool", {"key": "value"})
-
-        assert is_error is True
-        assert len(content) == 1
-        assert content[0]["type"] == "text"
-        assert isinstance(content[0]["text"], str)
-        assert len(content[0]["text"]) > 0
-
-    async def test_nonexistent_tool_with_raising_executor(self) -> None:
-        """An executor that raises a generic exception for unknown tools produces sanitized error."""
-
-        class RaisingExecutor:
-            async def call_async(self, module_id: str, inputs: Any = None) -> Any:
-                raise RuntimeError(f"Module not found: {module_id}")
-
-        router = ExecutionRouter(RaisingExecutor())
-
-        content, is_error, trace_id = await router.handle_call("nonexistent.tool", {"key": "value"})
+    @pytest.mark.parametrize(
+        "executor",
+        [StrictExecutor(known={"image.resize": {"status": "ok"}}), RaisingExecutor()],
+        ids=["strict-executor", "raising-executor"],
+    )
+    async def test_nonexistent_tool_returns_sanitized_error(self, executor: Any) -> None:
+        """Calling an unknown tool returns is_error=True with one sanitized text entry."""
+        content, is_error, trace_id = await ExecutionRouter(executor).handle_call("nonexistent.tool", {"key": "value"})
 
         assert is_error is True
         assert len(content) == 1
@@ -303,66 +323,71 @@ class TestOpenAIToolsRoundtrip:
     """TC-INT-004: to_openai_tools() produces valid OpenAI-compatible tool definitions.
 
     Uses a registry with 3 modules (simple, nested $ref, empty schemas) and
-    validates the output structure matches the OpenAI API spec.
+    validates the output structure matches the OpenAI API spec. The
+    descriptors and registry are read-only and built once for the class.
     """
 
-    @pytest.fixture
+    @pytest.fixture(scope="class")
     def simple_desc(self) -> ModuleDescriptor:
         return ModuleDescriptor(
             module_id="text.summarize",
             description="Summarize text",
-            input_schema={
-                "type": "object",
-                "properties": {
-                    "text": {"type": "string"},
-                    "max_length": {"type": "integer"},
-                },
-                "required": ["text"],
-            },
-            output_schema={},
+            input_schema=_read_only(
+                {
+                    "type": "object",
+                    "properties": {
+                        "text": {"type": "string"},
+                        "max_length": {"type": "integer"},
+                    },
+                    "required": ["text"],
+                }
+            ),
+            output_schema=_read_only({}),
             tags=["text"],
         )
 
-    @pytest.fixture
+    @pytest.fixture(scope="class")
     def nested_desc(self) -> ModuleDescriptor:
         return ModuleDescriptor(
             module_id="workflow.run",
             description="Run a workflow",
-            input_schema={
-                "type": "object",
-                "$defs": {
-                    "Step": {
-                        "type": "object",
-                        "properties": {
-                            "name": {"type": "string"},
-                            "params": {"type": "object"},
+            input_schema=_read_only(
+                {
+                    "type": "object",
+                    "$defs": {
+                        "Step": {
+                            "type": "object",
+                            "properties": {
+                                "name": {"type": "string"},
+                                "params": {"type": "object"},
+                            },
+                            "required": ["name"],
+                        }
+                    },
+                    "properties": {
+                        "steps": {
+                            "type": "array",
+                            "items": {"$ref": "#/$defs/Step"},
                         },
-                        "required": ["name"],
-                    }
-                },
-                "properties": {
-                    "steps": {
-                        "type": "array",
-                        "items": {"$ref": "#/$defs/Step"},
                     },
-                },
-                "required": ["steps"],
-            },
-            output_schema={},
+                    "required": ["steps"],
+                }
+            ),
+            output_schema=_read_only({}),
             tags=["workflow"],
         )
 
-    @pytest.fixture
+    @pytest.fixture(scope="class")
     def empty_desc(self) -> ModuleDescriptor:
         return ModuleDescriptor(
             module_id="system.ping",
             description="Health check",
-            input_schema={},
-            output_schema={},
+            input_schema=_read_only({}),
+            output_schema=_read_only({}),
             tags=["system"],
         )
 
-    @pytest.fixture
+    @pytest.fixture(scope="class")
     def registry(
         self,
         simple_desc: ModuleDescriptor,
@@ -371,56 +396,40 @@ class TestOpenAIToolsRoundtrip:
     ) -> StubRegistry:
         return StubRegistry([simple_desc, nested_desc, empty_desc])
 
-    def test_returns_list_of_three(self, registry: StubRegistry) -> None:
+    @pytest.fixture(scope="class")
+    def openai_tools(self, registry: StubRegistry) -> list[dict[str, Any]]:
+        return to_openai_tools(registry)
+
+    @pytest.fixture(scope="class")
+    def openai_tools_by_name(self, openai_tools: list[dict[str, Any]]) -> dict[str, dict[str, Any]]:
+        return {t["function"]["name"]: t for t in openai_tools}
+
+    def test_returns_list_of_three(self, openai_tools: list[dict[str, Any]]) -> None:
         """to_openai_tools returns exactly 3 tool definitions."""
-        tools = to_openai_tools(registry)
-        assert isinstance(tools, list)
-        assert len(tools) == 3
-
-    def test_each_tool_has_correct_top_level_structure(self, registry: StubRegistry) -> None:
-        """Each tool dict has {type: 'function', function: {...}}."""
-        tools = to_openai_tools(registry)
-        for tool in tools:
-            assert isinstance(tool, dict)
-            assert tool["type"] == "function"
-            assert "function" in tool
-            assert isinstance(tool["function"], dict)
-
-    def test_each_function_has_required_keys(self, registry: StubRegistry) -> None:
-        """Each function dict has name, description, and parameters keys."""
-        tools = to_openai_tools(registry)
-        required_keys = {"name", "description", "parameters"}
-        for tool in tools:
-            fn = tool["function"]
-            assert required_keys.issubset(
-                fn.keys()
-            ), f"Missing keys in {fn.get('name', 'unknown')}: {required_keys - fn.keys()}"
-
-    def test_module_ids_are_normalized(self, registry: StubRegistry) -> None:
-        """All module IDs are normalized (dots replaced with dashes for OpenAI)."""
-        tools = to_openai_tools(registry)
-        names = [tool["function"]["name"] for tool in tools]
-        for name in names:
-            assert "." not in name, f"Name '{name}' still contains dots"
-
-    def test_normalized_names_match_expected(self, registry: StubRegistry) -> None:
+        assert isinstance(openai_tools, list)
+        assert len(openai_tools) == 3
+
+    @pytest.mark.parametrize("name", ["system-ping", "text-summarize", "workflow-run"])
+    def test_tool_has_valid_structure(self, openai_tools_by_name: dict[str, dict[str, Any]], name: str) -> None:
+        """Each tool is {type: 'function', function: {name, description, parameters}}
+        with a dot-free normalized name and an object parameters schema."""
+        tool = openai_tools_by_name[name]
+        assert tool["type"] == "function"
+        fn = tool["function"]
+        assert isinstance(fn, dict)
+        assert {"name", "description", "parameters"}.issubset(fn)
+        assert "." not in fn["name"]
+        assert isinstance(fn["parameters"], dict)
+        assert fn["parameters"].get("type") == "object"
+
+    def test_normalized_names_match_expected(self, openai_tools: list[dict[str, Any]]) -> None:
         """Normalized names are as expected (dot -> dash)."""
-        tools = to_openai_tools(registry)
-        names = sorted(tool["function"]["name"] for tool in tools)
+        names = sorted(tool["function"]["name"] for tool in openai_tools)
         assert names == ["system-ping", "text-summarize", "workflow-run"]
 
-    def test_parameters_are_valid_json_schema(self, registry: StubRegistry) -> None:
-        """All parameters are valid JSON Schema objects with type: 'object'."""
-        tools = to_openai_tools(registry)
-        for tool in tools:
-            params = tool["function"]["parameters"]
-            assert isinstance(params, dict)
-            assert params.get("type") == "object", f"Parameters for {tool['function']['name']} missing type: object"
-
-    def test_nested_ref_schema_is_inlined(self, registry: StubRegistry) -> None:
+    def test_nested_ref_schema_is_inlined(self, openai_tools_by_name: dict[str, dict[str, Any]]) -> None:
         """The $ref in the nested schema is resolved and inlined, $defs removed."""
-        tools = to_openai_tools(registry)
-        workflow_tool = next(t for t in tools if t["function"]["name"] == "workflow-run")
+        workflow_tool = openai_tools_by_name["workflow-run"]
         params = workflow_tool["function"]["parameters"]
 
         # $defs should be removed
@@ -433,10 +442,9 @@ class TestOpenAIToolsRoundtrip:
         assert items["type"] == "object"
         assert "name" in items["properties"]
 
-    def test_empty_schema_gets_default(self, registry: StubRegistry) -> None:
+    def test_empty_schema_gets_default(self, openai_tools_by_name: dict[str, dict[str, Any]]) -> None:
         """Empty input_schema is converted to {type: 'object', properties: {}}."""
-        tools = to_openai_tools(registry)
-        ping_tool = next(t for t in tools if t["function"]["name"] == "system-ping")
+        ping_tool = openai_tools_by_name["system-ping"]
         params = ping_tool["function"]["parameters"]
         assert params == {"type": "object", "properties": {}}
 
@@ -450,17 +458,18 @@ class TestACLEnforcement:
     """TC-INT-005: Executor passthrough with ACL enforcement.
 
     Validates that the ExecutionRouter + ErrorMapper correctly handle
-    both successful calls and ACL-denied errors from the Executor.
+    both successful calls and ACL-denied errors from the Executor. The
+    stub executor is stateless, so one executor and router serve the class.
     """
 
-    @pytest.fixture
+    @pytest.fixture(scope="class")
     def executor(self) -> StubExecutor:
         return StubExecutor(
             results={"public.tool": {"result": "ok"}},
-            errors={"private.tool": StubACLDeniedError()},
+            errors={"private.tool": _ACL_DENIED_ERROR},
         )
 
-    @pytest.fixture
+    @pytest.fixture(scope="class")
     def router(self, executor: StubExecutor) -> ExecutionRouter:
         return ExecutionRouter(executor)
 
@@ -469,8 +478,7 @@ class TestACLEnforcement:
         content, is_error, trace_id = await router.handle_call("public.tool", {})
 
         assert is_error is False
-        parsed = json.loads(content[0]["text"])
-        assert parsed == {"result": "ok"}
+        _assert_json_equals(content, {"result": "ok"})
 
     async def test_private_tool_returns_error(self, router: ExecutionRouter) -> None:
         """Calling a private tool returns is_error=True."""
@@ -490,14 +498,24 @@ class TestACLEnforcement:
         # Public tool call
         content_pub, is_error_pub, _trace_pub = await router.handle_call("public.tool", {})
         assert is_error_pub is False
-        parsed = json.loads(content_pub[0]["text"])
-        assert parsed == {"result": "ok"}
+        _assert_json_equals(content_pub, {"result": "ok"})
 
         # Private tool call
         content_priv, is_error_priv, _trace_priv = await router.handle_call("private.tool", {})
         assert is_error_priv is True
         assert "access denied" in content_priv[0]["text"].lower()
 
+    async def test_both_tools_concurrently(self, router: ExecutionRouter) -> None:
+        """Concurrent public and private calls on one router keep their own outcomes."""
+        (content_pub, is_error_pub, _), (content_priv, is_error_priv, _) = await asyncio.gather(
+            router.handle_call("public.tool", {}),
+            router.handle_call("private.tool", {}),
+        )
+        assert is_error_pub is False
+        _assert_json_equals(content_pub, {"result": "ok"})
+        assert is_error_priv is True
+        assert "access denied" in content_priv[0]["text"].lower()
+
 
 # ---------------------------------------------------------------------------
 # TC-INT-006: Dynamic registration -- add module while components are running
@@ -515,10 +533,6 @@ class TestDynamicRegistration:
     def registry(self) -> EventRegistry:
         return EventRegistry()
 
-    @pytest.fixture
-    def factory(self) -> MCPServerFactory:
-        return MCPServerFactory()
-
     @pytest.fixture
     def listener(self, registry: EventRegistry, factory: MCPServerFactory) -> RegistryListener:
         return RegistryListener(registry=registry, factory=factory)
@@ -603,28 +617,36 @@ class TestDynamicRegistration:
         registry.trigger("unregister", "new.module")
         assert listener.tools == {}
 
+    @pytest.fixture(params=[3, 100], ids=lambda n: f"{n}-modules")
+    def module_count(self, request: pytest.FixtureRequest) -> int:
+        """Number of modules to register; the larger case guards against listener slowdowns."""
+        return request.param
+
     def test_multiple_modules_register_and_unregister(
-        self, listener: RegistryListener, registry: EventRegistry
+        self, listener: RegistryListener, registry: EventRegistry, module_count: int
     ) -> None:
         """Registering multiple modules and selectively unregistering works."""
-        listener.start()
-
-        for i in range(3):
-            desc = ModuleDescriptor(
+        descriptors = tuple(
+            ModuleDescriptor(
                 module_id=f"module.{i}",
                 description=f"Module {i}",
                 input_schema={"type": "object", "properties": {}},
                 output_schema={},
             )
-            registry.add_definition(desc)
-            registry.trigger("register", f"module.{i}")
+            for i in range(module_count)
+        )
+        registry.add_many(descriptors)
+        listener.start()
+
+        for desc in descriptors:
+            registry.trigger("register", desc.module_id)
 
-        assert len(listener.tools) == 3
+        assert len(listener.tools) == module_count
 
         # Unregister one
         registry.trigger("unregister", "module.1")
         tools = listener.tools
-        assert len(tools) == 2
+        assert len(tools) == module_count - 1
         assert "module.0" in tools
         assert "module.1" not in tools
-        assert "module.2" in tools
+        assert f"module.{module_count - 1}" in tools
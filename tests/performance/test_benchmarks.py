@@ -11,8 +11,11 @@ import asyncio
 import json
 import time
 import tracemalloc
+from types import MappingProxyType
 from typing import Any
 
+import pytest
+
 from apcore_mcp.adapters.schema import SchemaConverter
 from apcore_mcp.converters.openai import OpenAIConverter
 from apcore_mcp.server.factory import MCPServerFactory
@@ -62,6 +65,14 @@ class StubExecutor:
 # Helpers
 # ---------------------------------------------------------------------------
 
+_IDEMPOTENT = ModuleAnnotations(idempotent=True)
+
+# Every generated descriptor shares this read-only output schema rather than
+# allocating its own copy; nothing in the build path mutates output schemas.
+_RESULT_OUTPUT_SCHEMA = MappingProxyType(
+    {"type": "object", "properties": MappingProxyType({"result": MappingProxyType({"type": "string"})})}
+)
+
 
 def _make_descriptor(index: int, num_properties: int, with_ref: bool) -> ModuleDescriptor:
     """Create a ModuleDescriptor with the given number of properties.
@@ -99,19 +110,21 @@ def _make_descriptor(index: int, num_properties: int, with_ref: bool) -> ModuleD
         module_id=f"perf.module_{index:04d}",
         description=f"Performance test module {index}",
         input_schema=schema,
-        output_schema={"type": "object", "properties": {"result": {"type": "string"}}},
-        annotations=ModuleAnnotations(idempotent=True),
+        output_schema=_RESULT_OUTPUT_SCHEMA,
+        annotations=_IDEMPOTENT,
     )
 
 
 def _make_descriptors(count: int = 100) -> list[ModuleDescriptor]:
     """Create *count* descriptors, ~20% with $ref nodes."""
-    descriptors = []
-    for i in range(count):
-        num_props = 5 + (i % 6)  # 5-10 properties
-        with_ref = i % 5 == 0  # 20% have $ref
-        descriptors.append(_make_descriptor(i, num_props, with_ref))
-    return descriptors
+    return [
+        _make_descriptor(
+            i,
+            5 + (i % 6),  # 5-10 properties
+            i % 5 == 0,  # 20% have $ref
+        )
+        for i in range(count)
+    ]
 
 
 # ---------------------------------------------------------------------------
@@ -150,9 +163,10 @@ class TestRoutingOverhead:
         router = ExecutionRouter(executor)
 
         iterations = 1000
+        args = {"key": "value"}
         start = time.perf_counter()
         for _ in range(iterations):
-            content, is_error, trace_id = await router.handle_call("perf.test", {"key": "value"})
+            content, is_error, trace_id = await router.handle_call("perf.test", args)
             assert is_error is False
         elapsed = time.perf_counter() - start
 
@@ -225,9 +239,14 @@ class TestConcurrentCalls:
         for i, (content, _, _trace) in enumerate(outcomes):
             parsed = json.loads(content[0]["text"])
             assert parsed["id"] == i, f"Result cross-contamination: expected id={i}, got id={parsed['id']}"
-            assert (
-                parsed["data"] == f"result_{i}"
-            ), f"Result cross-contamination: expected data='result_{i}', got '{parsed['data']}'"
+            assert parsed["data"] == f"result_{i}", (
+                f"Result cross-contamination: expected data='result_{i}', got '{parsed['data']}'"
+            )
+
+    async def test_runs_on_uvloop_when_installed(self) -> None:
+        """The timing budgets above assume the uvloop policy from tests/conftest.py is active."""
+        uvloop = pytest.importorskip("uvloop")
+        assert isinstance(asyncio.get_running_loop(), uvloop.Loop)
 
 
 # ---------------------------------------------------------------------------
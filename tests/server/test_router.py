@@ -298,6 +298,17 @@ class TestExecutionRouter:
         # Must NOT leak the caller_id
         assert "secret_user_42" not in content[0]["text"]
 
+    async def test_sanitized_error_content_is_fresh_per_call(self) -> None:
+        """Each call gets its own content list, so mutating one result can't leak into the next."""
+        router = ExecutionRouter(StubExecutor(error=ACLDeniedStubError("u1", "admin.delete")))
+
+        first, _, _ = await router.handle_call("admin.delete", {})
+        first[0]["text"] = "tampered"
+        first.append({"type": "text", "text": "extra"})
+        second, _, _ = await router.handle_call("admin.delete", {})
+
+        assert second == [{"type": "text", "text": "Access denied"}]
+
     async def test_handle_call_internal_error_codes(self) -> None:
         """CALL_DEPTH_EXCEEDED, CIRCULAR_CALL, CALL_FREQUENCY_EXCEEDED return 'Internal error occurred'."""
         internal_errors = [